@@ -19,24 +19,46 @@
 # Author: Claude
 # Version: 5.0
 
-from burp import IBurpExtender, ITab, IProxyListener, IHttpListener
+from burp import IBurpExtender, ITab, IProxyListener, IHttpListener, IExtensionStateListener
 from javax.swing import (JPanel, JTable, JScrollPane, JButton, JTextField, JLabel, 
                          JTabbedPane, JSplitPane, JTextArea, BoxLayout, BorderFactory,
                          JCheckBox, SwingConstants, JOptionPane, SwingUtilities,
                          ListSelectionModel, JComboBox, JDialog, JFrame, JTextPane,
-                         JFileChooser, RowSorter, SortOrder)
+                         JFileChooser, RowSorter, RowFilter, SortOrder, Timer,
+                         DefaultComboBoxModel)
 from javax.swing.table import AbstractTableModel, DefaultTableCellRenderer, TableRowSorter
-from javax.swing.text import StyleConstants, SimpleAttributeSet, StyleContext
+from javax.swing.text import StyleConstants, SimpleAttributeSet, StyleContext, DefaultStyledDocument
 from javax.swing.filechooser import FileNameExtensionFilter
 from java.awt import BorderLayout, GridBagLayout, GridBagConstraints, Insets, Color, Font, FlowLayout, Dimension, GridLayout
-from java.util import ArrayList, Comparator
-from threading import Thread, Lock
+from java.awt.event import AdjustmentListener, HierarchyEvent
+from java.util import ArrayList, Collections, Comparator, Date, WeakHashMap
+from java.util.concurrent import (Callable, ConcurrentHashMap, CopyOnWriteArrayList, ThreadPoolExecutor,
+                                  LinkedBlockingQueue, SynchronousQueue, TimeUnit, ThreadFactory,
+                                  RejectedExecutionException, TimeoutException)
+from java.util.concurrent.atomic import AtomicBoolean, AtomicInteger
+from java.util.concurrent.locks import ReentrantReadWriteLock
+from java.util.regex import Pattern
+from java.text import SimpleDateFormat
+from java.security import MessageDigest
+from java.nio import ByteBuffer
+from java.util.zip import CRC32, Adler32
+try:
+    from java.util.zip import CRC32C as BodyCRC  # Java 9+, hardware-accelerated
+except ImportError:
+    BodyCRC = CRC32
+from jarray import array
+from threading import Lock, local
 import java.io
-import hashlib
+import java.lang
+import java.net
+import java.nio.file
+import java.nio.charset
 import json
 import time
 import base64
+import csv
 import difflib
+from collections import OrderedDict
 
 
 # Auth mode constants
@@ -49,6 +71,10 @@ AUTH_CUSTOM = "Custom Header"
 
 AUTH_MODES = [AUTH_AUTO, AUTH_COOKIES, AUTH_BEARER, AUTH_BOTH, AUTH_NONE, AUTH_CUSTOM]
 
+# Auth modes that capture and send each credential type
+BEARER_AUTH_MODES = frozenset([AUTH_AUTO, AUTH_BEARER, AUTH_BOTH])
+COOKIE_AUTH_MODES = frozenset([AUTH_AUTO, AUTH_COOKIES, AUTH_BOTH])
+
 # Burp tool flag constants
 TOOL_PROXY = 0x00000004
 TOOL_SCANNER = 0x00000010
@@ -56,8 +82,19 @@ TOOL_INTRUDER = 0x00000020
 TOOL_REPEATER = 0x00000040
 TOOL_EXTENDER = 0x00000400
 
+# Header added to every mirrored request so it is never mirrored again
+MIRROR_MARKER_HEADER = "X-DomainMirror-Internal: true"
+
+# Write buffer for session saves and exports - they issue many small writes
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Side-by-side compares longer than this show only the changed hunks, with
+# this many context lines around each
+SIDE_BY_SIDE_HUNK_LINES = 2000
+SIDE_BY_SIDE_CONTEXT = 3
+
 
-class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
+class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener, IExtensionStateListener):
     
     def registerExtenderCallbacks(self, callbacks):
         self._callbacks = callbacks
@@ -77,12 +114,23 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         #       "refresh_token": "",
         #       "token_expiry": None,
         #       "last_updated": None,
-        #       "status": "waiting"
+        #       "status": "waiting",
+        #       "cookie_version": 0,       # bumped on every cookie change
+        #       "cookie_header": None,     # (cookie_version, "Cookie: k=v; k=v") cache
+        #       "bearer_header": None      # (bearer, "Authorization: Bearer ...") cache
         #   }
         # }
-        self.domains = ArrayList()
+        # domains keeps table order (copy-on-write, so readers never lock);
+        # _domain_map indexes the same entries by domain for O(1) host lookup.
+        # domains_lock only serializes mutations that touch both.
+        self.domains = CopyOnWriteArrayList()
+        self._domain_map = ConcurrentHashMap()
         self.domains_lock = Lock()
         
+        # Immutable (primary_entry, mirror_entries) snapshot, rebuilt only when
+        # the domain list changes so the listeners never rescan it
+        self._topology = (None, ())
+        
         # Configuration
         self.login_patterns = [
             "/login", "/signin", "/auth", "/authenticate", "/oauth", 
@@ -91,10 +139,7 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         self.refresh_patterns = ["/refresh", "/token/refresh", "/auth/refresh"]
         self.token_keys = ["access_token", "accessToken", "token", "id_token", "jwt", "bearer"]
         self.refresh_token_keys = ["refresh_token", "refreshToken"]
-        
-        # Results
-        self.results = ArrayList()
-        self.results_lock = Lock()
+        self._compile_patterns()
         
         # Flags
         self.capture_enabled = True
@@ -109,28 +154,121 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         self.mirror_from_intruder = False
         self.mirror_from_extender = False
         
-        # Pending refresh
-        self.pending_refresh = set()
-        self.pending_refresh_lock = Lock()
+        # Domains with a token refresh in flight (concurrent set - add() is the
+        # atomic claim, so no lock is needed)
+        self.pending_refresh = ConcurrentHashMap.newKeySet()
         
-        # Track our own mirror requests to prevent infinite loops
-        self._our_mirror_requests = set()
-        self._our_requests_lock = Lock()
+        # Track our own in-flight mirror requests (64-bit digest key -> number
+        # in flight) to prevent infinite loops. Byte-identical requests share a
+        # key, so it is counted and only dropped when the last one finishes
+        self._our_mirror_requests = ConcurrentHashMap()
+        self._mirror_marker_bytes = self._helpers.stringToBytes(MIRROR_MARKER_HEADER)
+        self._newline_bytes = self._helpers.stringToBytes("\n")
+        self._header_end_bytes = self._helpers.stringToBytes("\r\n\r\n")
+        self._lf_header_end_bytes = self._helpers.stringToBytes("\n\n")
         
         # Safeguards against resource exhaustion
         self._max_results = 1000  # Maximum number of results to keep
-        self._active_mirror_threads = 0
         self._max_concurrent_mirrors = 10  # Maximum concurrent mirror threads
-        self._mirror_thread_lock = Lock()
+        self._mirror_queue_size = 256  # Mirror jobs allowed to wait for a free thread
+        self._mirror_skipped = AtomicInteger()  # Jobs dropped since the queue last had room
         self._request_timeout = 15  # Seconds to wait for mirror responses
         self._max_diff_lines = 500  # Maximum lines to show in diff view
         
+        # Results - ring buffer holding at most _max_results, oldest evicted first
+        self.results = ResultStore(self._max_results)
+        # Readers (table sync, selection, counts, save) share the read lock;
+        # only add/clear/resize take the exclusive write lock
+        self.results_lock = ReentrantReadWriteLock()
+        self._results_read_lock = self.results_lock.readLock()
+        self._results_write_lock = self.results_lock.writeLock()
+        # Bumped whenever existing rows shift (clear, eviction, replace) so the
+        # table model knows appends alone cannot describe the change
+        self._results_generation = 0
+        
+        # LRU of rendered unified diffs keyed by body digests, so re-selecting
+        # a result (or another with the same bodies) skips difflib entirely
+        self._diff_cache = OrderedDict()
+        self._diff_cache_lock = Lock()
+        self._diff_cache_size = 256
+        
+        # Matching mirrors share the primary's body array, so decoded bodies
+        # are memoized per array (identity keys) and every record sharing it
+        # gets the same string. Entries go once no record holds the array
+        self._decoded_bodies = Collections.synchronizedMap(WeakHashMap())
+        
+        # Reusable worker pool for mirroring (and other background jobs).
+        # Jobs beyond the queue capacity are rejected and skipped.
+        self._mirror_pool = ThreadPoolExecutor(
+            self._max_concurrent_mirrors, self._max_concurrent_mirrors,
+            30, TimeUnit.SECONDS,
+            LinkedBlockingQueue(self._mirror_queue_size),
+            DaemonThreadFactory("DomainMirror-worker"))
+        self._mirror_pool.allowCoreThreadTimeOut(True)
+        
+        # Separate small pool for session refreshes, so "Refresh All" can wait
+        # on them from a mirror worker without starving the mirror pool
+        self._refresh_pool = ThreadPoolExecutor(
+            4, 4, 30, TimeUnit.SECONDS,
+            LinkedBlockingQueue(),
+            DaemonThreadFactory("DomainMirror-refresh"))
+        self._refresh_pool.allowCoreThreadTimeOut(True)
+        
+        # Threads that run the blocking makeHttpRequest calls, so callers can
+        # stop waiting after a timeout. Idle threads are reused instead of
+        # starting one per request; a hung request just keeps its thread
+        self._http_exec = ThreadPoolExecutor(
+            0, java.lang.Integer.MAX_VALUE, 60, TimeUnit.SECONDS,
+            SynchronousQueue(),
+            DaemonThreadFactory("DomainMirror-http"))
+        
+        # One single-thread executor per heavy comparison view. A new selection
+        # cancels the view's previous job, and jobs run in submission order, so
+        # the latest selection's render is always the last to reach the EDT
+        self._diff_exec = ThreadPoolExecutor(
+            1, 1, 30, TimeUnit.SECONDS,
+            LinkedBlockingQueue(),
+            DaemonThreadFactory("DomainMirror-diff"))
+        self._diff_exec.allowCoreThreadTimeOut(True)
+        self._sbs_exec = ThreadPoolExecutor(
+            1, 1, 30, TimeUnit.SECONDS,
+            LinkedBlockingQueue(),
+            DaemonThreadFactory("DomainMirror-side-by-side"))
+        self._sbs_exec.allowCoreThreadTimeOut(True)
+        self._diff_future = None
+        self._sbs_future = None
+        
+        # SimpleDateFormat is not thread-safe, so each thread keeps its own
+        # pattern -> formatter cache
+        self._date_formats = local()
+        
+        # Table refreshes requested from listener threads are coalesced and
+        # flushed on the EDT at most every 50ms (<= 20 repaints/sec). A table
+        # that isn't on screen keeps its refresh pending until it is shown.
+        # Only the request that raises the flag touches the timer, so a burst
+        # of results costs one timer start rather than one per result
+        self._results_refresh_pending = AtomicBoolean(False)
+        # Domains whose session changed since the last flush - only their rows
+        # are repainted
+        self._dirty_domains = ConcurrentHashMap.newKeySet()
+        self._refresh_timer = Timer(50, lambda e: self._flush_pending_refreshes())
+        self._refresh_timer.setRepeats(False)
+        
+        # Log lines are queued from any thread and appended to the log area in
+        # one batch per 100ms, instead of one EDT task per line. The area keeps
+        # only the most recent _max_log_chars characters
+        self._log_queue = LinkedBlockingQueue()
+        self._log_timer = Timer(100, lambda e: self._flush_log())
+        self._log_timer.setRepeats(False)
+        self._max_log_chars = 500000
+        
         # Build UI
         self._build_ui()
         
         # Register listeners
         callbacks.registerProxyListener(self)
         callbacks.registerHttpListener(self)
+        callbacks.registerExtensionStateListener(self)
         callbacks.addSuiteTab(self)
         
         self._log("Extension loaded! Add domains and configure auth modes.")
@@ -175,6 +313,7 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         self._domain_table = JTable(self._domain_model)
         self._domain_table.setSelectionMode(ListSelectionModel.SINGLE_SELECTION)
         self._domain_table.setRowHeight(25)
+        self._domain_table.addHierarchyListener(lambda e: self._on_table_shown(e))
         
         # Renderers
         self._domain_table.getColumnModel().getColumn(2).setCellRenderer(AuthModeCellRenderer())
@@ -229,9 +368,8 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         
         refresh_btn = JButton("Refresh All Sessions")
         def start_refresh():
-            t = Thread(target=self._refresh_all_sessions)
-            t.daemon = True
-            t.start()
+            if not self._submit_background(self._refresh_all_sessions):
+                self._log("WARNING: Worker pool busy, refresh not started")
         refresh_btn.addActionListener(lambda e: start_refresh())
         control_panel.add(refresh_btn)
         
@@ -287,33 +425,60 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         dialog.setVisible(True)
         
         if dialog.result:
+            dialog.result["domain"] = self._normalize_domain(dialog.result["domain"])
+            if not dialog.result["domain"]:
+                return
+            
+            new_domain = dialog.result["domain"]
             with self.domains_lock:
-                # Update entry
-                entry["domain"] = dialog.result["domain"]
-                entry["auth_mode"] = dialog.result["auth_mode"]
-                entry["custom_header_name"] = dialog.result.get("custom_header_name", "")
-                entry["custom_header_value"] = dialog.result.get("custom_header_value", "")
+                # Refuse a rename onto another configured domain - mutations
+                # are serialized by the lock, so the containsKey check holds
+                old_domain = entry["domain"]
+                renamed = new_domain != old_domain
+                duplicate = renamed and self._domain_map.containsKey(new_domain)
+                if not duplicate:
+                    # Update the entry before publishing it under the new key,
+                    # so lock-free lookups never see it carrying the old name
+                    entry["domain"] = new_domain
+                    entry["auth_mode"] = dialog.result["auth_mode"]
+                    entry["custom_header_name"] = dialog.result.get("custom_header_name", "")
+                    entry["custom_header_value"] = dialog.result.get("custom_header_value", "")
+                    if renamed:
+                        self._domain_map.put(new_domain, entry)
+                        self._domain_map.remove(old_domain)
+                    self._rebuild_topology()
+            
+            if duplicate:
+                JOptionPane.showMessageDialog(self._main_panel, "Domain already exists!")
+                return
             
-            self._domain_model.fireTableDataChanged()
+            self._domain_model.fireTableRowsUpdated(row, row)
             self._log("Updated domain: " + entry["domain"])
     
+    def _normalize_domain(self, value):
+        """Reduce user input like 'https://Host.example.com/path' to a bare lowercase host"""
+        value = value.strip()
+        try:
+            host = java.net.URI(value if "://" in value else "http://" + value).getHost()
+            if host:
+                return host.lower()
+        except:
+            pass
+        # Not a parseable URI (e.g. underscores in the host) - strip scheme/path by hand
+        if "://" in value:
+            value = value.split("://", 1)[1]
+        return value.split("/", 1)[0].lower()
+    
     def _add_domain_entry(self, config):
         """Add domain with config"""
-        domain = config["domain"].strip().lower()
-        domain = domain.replace("https://", "").replace("http://", "").split("/")[0]
+        domain = self._normalize_domain(config["domain"])
         
         if not domain:
             return
         
-        self._debug_print("Adding domain: '" + domain + "'")
+        self._debug_print("Adding domain: '%s'", domain)
         
         with self.domains_lock:
-            # Check duplicate
-            for i in range(self.domains.size()):
-                if self.domains.get(i)["domain"] == domain:
-                    JOptionPane.showMessageDialog(self._main_panel, "Domain already exists!")
-                    return
-            
             is_primary = self.domains.size() == 0
             
             new_entry = {
@@ -332,10 +497,19 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
                 }
             }
             
-            self.domains.add(new_entry)
-            self._debug_print("Domain added. Total domains: " + str(self.domains.size()))
+            # Check duplicate
+            duplicate = self._domain_map.putIfAbsent(domain, new_entry) is not None
+            if not duplicate:
+                self.domains.add(new_entry)
+                new_row = self.domains.size() - 1
+                self._rebuild_topology()
+                self._debug_print("Domain added. Total domains: %s", self.domains.size())
+        
+        if duplicate:
+            JOptionPane.showMessageDialog(self._main_panel, "Domain already exists!")
+            return
         
-        self._domain_model.fireTableDataChanged()
+        self._domain_model.fireTableRowsInserted(new_row, new_row)
         self._log("Added domain: " + domain + " [" + config.get("auth_mode", AUTH_AUTO) + "]")
     
     def _remove_domain(self):
@@ -344,15 +518,22 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         if row < 0:
             return
         
+        promoted = False
         with self.domains_lock:
-            if row < self.domains.size():
-                removed = self.domains.remove(row)
-                self._log("Removed: " + removed["domain"])
-                
-                if removed["is_primary"] and self.domains.size() > 0:
-                    self.domains.get(0)["is_primary"] = True
-        
-        self._domain_model.fireTableDataChanged()
+            if row >= self.domains.size():
+                return
+            removed = self.domains.remove(row)
+            self._domain_map.remove(removed["domain"])
+            self._log("Removed: " + removed["domain"])
+            
+            if removed["is_primary"] and self.domains.size() > 0:
+                self.domains.get(0)["is_primary"] = True
+                promoted = True
+            self._rebuild_topology()
+        
+        self._domain_model.fireTableRowsDeleted(row, row)
+        if promoted:
+            self._domain_model.fireTableRowsUpdated(0, 0)
     
     def _set_primary(self):
         """Set selected as primary"""
@@ -360,11 +541,18 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         if row < 0:
             return
         
+        changed_rows = []
         with self.domains_lock:
             for i in range(self.domains.size()):
-                self.domains.get(i)["is_primary"] = (i == row)
-        
-        self._domain_model.fireTableDataChanged()
+                entry = self.domains.get(i)
+                if entry["is_primary"] != (i == row):
+                    entry["is_primary"] = (i == row)
+                    changed_rows.append(i)
+            self._rebuild_topology()
+        
+        # Only the old and new primary rows change
+        for i in changed_rows:
+            self._domain_model.fireTableRowsUpdated(i, i)
     
     def _clear_selected_session(self):
         """Clear session for selected domain"""
@@ -385,7 +573,7 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
                 }
                 self._log("Cleared session: " + entry["domain"])
         
-        self._domain_model.fireTableDataChanged()
+        self._domain_model.fireTableRowsUpdated(row, row)
         self._update_session_detail()
     
     def _on_domain_selected(self):
@@ -408,61 +596,67 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
             session = entry["session"]
             auth_mode = entry["auth_mode"]
             
-            text = "=" * 55 + "\n"
-            text += "DOMAIN: " + domain + "\n"
-            text += "=" * 55 + "\n\n"
+            sb = java.lang.StringBuilder(1024)
+            sb.append("=" * 55).append("\n")
+            sb.append("DOMAIN: ").append(domain).append("\n")
+            sb.append("=" * 55).append("\n\n")
             
-            text += "CONFIGURATION:\n"
-            text += "  Role: " + ("PRIMARY" if entry["is_primary"] else "Mirror") + "\n"
-            text += "  Auth Mode: " + auth_mode + "\n"
+            sb.append("CONFIGURATION:\n")
+            sb.append("  Role: ").append("PRIMARY" if entry["is_primary"] else "Mirror").append("\n")
+            sb.append("  Auth Mode: ").append(auth_mode).append("\n")
             
             if auth_mode == AUTH_CUSTOM:
-                text += "  Custom Header: " + entry.get("custom_header_name", "") + "\n"
+                sb.append("  Custom Header: ").append(entry.get("custom_header_name", "")).append("\n")
                 val = entry.get("custom_header_value", "")
-                text += "  Custom Value: " + (val[:30] + "..." if len(val) > 30 else val) + "\n"
+                self._append_capped(sb.append("  Custom Value: "), val, 30).append("\n")
             
-            text += "  Status: " + session["status"].upper() + "\n"
-            text += "\n"
+            sb.append("  Status: ").append(session["status"].upper()).append("\n")
+            sb.append("\n")
             
-            text += "CAPTURED SESSION DATA:\n"
-            text += "-" * 55 + "\n"
+            sb.append("CAPTURED SESSION DATA:\n")
+            sb.append("-" * 55).append("\n")
             
             # Bearer
             bearer = session.get("bearer", "")
             if bearer:
-                text += "Access Token:\n  " + bearer[:70] + ("..." if len(bearer) > 70 else "") + "\n\n"
+                self._append_capped(sb.append("Access Token:\n  "), bearer, 70).append("\n\n")
             else:
-                text += "Access Token: (not captured)\n\n"
+                sb.append("Access Token: (not captured)\n\n")
             
             # Refresh token
             refresh = session.get("refresh_token", "")
             if refresh:
-                text += "Refresh Token:\n  " + refresh[:70] + ("..." if len(refresh) > 70 else "") + "\n\n"
+                self._append_capped(sb.append("Refresh Token:\n  "), refresh, 70).append("\n\n")
             
             # Expiry
             expiry = session.get("token_expiry")
             if expiry:
-                exp_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(expiry))
+                exp_str = self._format_time("yyyy-MM-dd HH:mm:ss", expiry)
                 remaining = int(expiry - time.time())
                 status = " (" + str(remaining) + "s remaining)" if remaining > 0 else " (EXPIRED)"
-                text += "Token Expiry: " + exp_str + status + "\n\n"
+                sb.append("Token Expiry: ").append(exp_str).append(status).append("\n\n")
             
             # Cookies
             cookies = session.get("cookies", {})
             if cookies:
-                text += "Cookies (" + str(len(cookies)) + "):\n"
+                sb.append("Cookies (").append(str(len(cookies))).append("):\n")
                 for name, value in cookies.items():
-                    disp = value[:40] + "..." if len(value) > 40 else value
-                    text += "  " + name + " = " + disp + "\n"
+                    self._append_capped(sb.append("  ").append(name).append(" = "), value, 40).append("\n")
             else:
-                text += "Cookies: (none)\n"
+                sb.append("Cookies: (none)\n")
             
             # Last updated
             last = session.get("last_updated")
             if last:
-                text += "\nLast Updated: " + time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(last))
+                sb.append("\nLast Updated: ").append(self._format_time("yyyy-MM-dd HH:mm:ss", last))
         
-        self._session_detail.setText(text)
+        self._session_detail.setText(sb.toString())
+    
+    def _append_capped(self, sb, value, limit):
+        """Append value to a StringBuilder, cut at limit chars with '...' - returns sb"""
+        if len(value) > limit:
+            return sb.append(value, 0, limit).append("...")
+        return sb.append(value)
     
     def _toggle_mirroring(self):
         """Toggle mirroring"""
@@ -471,16 +665,15 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         self._log("Mirroring " + ("ENABLED" if self.mirror_enabled else "DISABLED"))
         
         # Debug: Print domains to console
-        self._debug_print("Toggle mirroring. domains.size() = " + str(self.domains.size()))
+        self._debug_print("Toggle mirroring. domains.size() = %s", self.domains.size())
         with self.domains_lock:
             for i in range(self.domains.size()):
                 e = self.domains.get(i)
-                self._debug_print("  [" + str(i) + "] " + e["domain"] + " (primary=" + str(e["is_primary"]) + ")")
+                self._debug_print("  [%s] %s (primary=%s)", i, e["domain"], e["is_primary"])
         
         if self.mirror_enabled:
-            # Show diagnostic info
-            primary = self._get_primary_domain()
-            mirrors = self._get_mirror_domains()
+            # Show diagnostic info - one read keeps primary and mirrors consistent
+            primary, mirrors = self._topology
             
             if primary:
                 self._log("PRIMARY: " + primary["domain"] + " (status: " + primary["session"]["status"] + ")")
@@ -509,19 +702,30 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
     
     def _clear_results(self):
         """Clear results"""
-        with self.results_lock:
+        self._results_write_lock.lock()
+        try:
             self.results.clear()
-        self._results_model.fireTableDataChanged()
+            self._results_generation += 1
+        finally:
+            self._results_write_lock.unlock()
+        self._results_model.sync()
         if hasattr(self, '_results_count_label'):
             self._update_results_count()
         self._log("Results cleared")
     
     def _refresh_all_sessions(self):
-        """Refresh all sessions"""
-        with self.domains_lock:
-            for i in range(self.domains.size()):
-                domain = self.domains.get(i)["domain"]
-                self._trigger_refresh(domain)
+        """Refresh all sessions in parallel, waiting up to the request timeout"""
+        tasks = ArrayList()
+        for entry in self.domains:
+            tasks.add(CallableTask(lambda domain=entry["domain"]: self._trigger_refresh(domain)))
+        if tasks.isEmpty():
+            return
+        
+        futures = self._refresh_pool.invokeAll(tasks, self._request_timeout, TimeUnit.SECONDS)
+        timed_out = sum(1 for f in futures if f.isCancelled())
+        if timed_out:
+            self._log("Refresh All: {} of {} domains timed out after {}s".format(
+                timed_out, tasks.size(), self._request_timeout))
     
     def _build_results_panel(self):
         """Build results panel with enhanced diff viewing"""
@@ -533,6 +737,7 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         self._results_table = JTable(self._results_model)
         self._results_table.setSelectionMode(ListSelectionModel.SINGLE_SELECTION)
         self._results_table.getSelectionModel().addListSelectionListener(lambda e: self._on_result_selected())
+        self._results_table.addHierarchyListener(lambda e: self._on_table_shown(e))
         
         # Enable sorting on the table
         self._results_sorter = TableRowSorter(self._results_model)
@@ -572,6 +777,7 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         self._diff_area = JTextPane()
         self._diff_area.setEditable(False)
         self._diff_area.setFont(Font("Monospaced", Font.PLAIN, 11))
+        self._diff_styles = self._build_diff_styles()
         self._comparison_tabs.addTab("Diff View", JScrollPane(self._diff_area))
         
         # Full responses panel - side by side comparison
@@ -616,7 +822,8 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         filter_panel.add(JLabel("   Max body display:"))
         self._body_limit_combo = JComboBox(["500 chars", "2000 chars", "5000 chars", "Full (no limit)"])
         self._body_limit_combo.setSelectedIndex(3)  # Default to full
-        self._body_limit_combo.addActionListener(lambda e: self._on_result_selected())
+        self._recompute_body_limit()
+        self._body_limit_combo.addActionListener(lambda e: self._on_body_limit_changed())
         filter_panel.add(self._body_limit_combo)
         
         # Sort options
@@ -658,6 +865,7 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         
         # Results count label
         self._results_count_label = JLabel("  Results: 0")
+        self._results_count_shown = None  # (shown, total, mismatches) on the label
         io_panel.add(self._results_count_label)
         
         top_panel.add(io_panel, BorderLayout.SOUTH)
@@ -671,7 +879,13 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
     
     def _apply_filter_and_refresh(self):
         """Apply filter and refresh the table"""
-        self._results_model.fireTableDataChanged()
+        filter_val = self._filter_combo.getSelectedItem()
+        if filter_val == "Mismatches Only":
+            self._results_sorter.setRowFilter(MatchRowFilter(self.results, False))
+        elif filter_val == "Matches Only":
+            self._results_sorter.setRowFilter(MatchRowFilter(self.results, True))
+        else:
+            self._results_sorter.setRowFilter(None)
         self._update_results_count()
     
     def _apply_sort(self):
@@ -699,8 +913,12 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
     
     def _update_results_count(self):
         """Update the results count label"""
-        total = self.results.size()
-        mismatches = sum(1 for i in range(total) if not self.results.get(i).get("match"))
+        self._results_read_lock.lock()
+        try:
+            total = self.results.size()
+            mismatches = self.results.mismatch_count()
+        finally:
+            self._results_read_lock.unlock()
         matches = total - mismatches
         
         filter_val = self._filter_combo.getSelectedItem() if hasattr(self, '_filter_combo') else "All"
@@ -712,16 +930,22 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         else:
             shown = matches
         
-        self._results_count_label.setText("  Results: {} shown ({} total, {} mismatches)".format(shown, total, mismatches))
+        # Refresh flushes outnumber count changes (session captures, repeat
+        # flushes while the ring buffer is full), so skip unchanged counts
+        counts = (shown, total, mismatches)
+        if counts != self._results_count_shown:
+            self._results_count_shown = counts
+            self._results_count_label.setText("  Results: {} shown ({} total, {} mismatches)".format(*counts))
     
     def _clear_results_with_confirm(self):
         """Clear results with confirmation"""
-        if self.results.size() == 0:
+        count = self.results.size()
+        if count == 0:
             return
         
         result = JOptionPane.showConfirmDialog(
             self._main_panel,
-            "Are you sure you want to clear all {} results?".format(self.results.size()),
+            "Are you sure you want to clear all {} results?".format(count),
             "Confirm Clear",
             JOptionPane.YES_NO_OPTION
         )
@@ -734,7 +958,7 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         try:
             chooser = JFileChooser()
             chooser.setDialogTitle("Save Session Results")
-            chooser.setSelectedFile(java.io.File("domain_mirror_session_" + time.strftime("%Y%m%d_%H%M%S") + ".json"))
+            chooser.setSelectedFile(java.io.File("domain_mirror_session_" + self._format_time("yyyyMMdd_HHmmss") + ".json"))
             chooser.setFileFilter(FileNameExtensionFilter("JSON Files", ["json"]))
             
             if chooser.showSaveDialog(self._main_panel) != JFileChooser.APPROVE_OPTION:
@@ -744,30 +968,31 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
             if not filepath.endswith(".json"):
                 filepath += ".json"
             
-            # Convert results to serializable format
-            session_data = {
-                "version": "5.0",
-                "exported": time.strftime("%Y-%m-%d %H:%M:%S"),
-                "results": []
-            }
-            
-            for i in range(self.results.size()):
-                r = self.results.get(i)
-                session_data["results"].append({
-                    "method": r.get("method", ""),
-                    "path": r.get("path", ""),
-                    "timestamp": r.get("timestamp", ""),
-                    "match": r.get("match", True),
-                    "responses": r.get("responses", {})
-                })
+            # Snapshot the result references; records are serialized one at a
+            # time so only a single record's JSON is held in memory at once
+            results = self._results_snapshot()
             
-            with open(filepath, "w") as f:
-                json.dump(session_data, f, indent=2)
+            compact = (",", ":")
+            with open(filepath, "w", EXPORT_BUFFER_SIZE) as f:
+                f.write('{"version":"5.0","exported":')
+                f.write(json.dumps(self._format_time("yyyy-MM-dd HH:mm:ss")))
+                f.write(',"results":[')
+                for n, r in enumerate(results):
+                    if n:
+                        f.write(",\n")
+                    f.write(json.dumps({
+                        "method": r.get("method", ""),
+                        "path": r.get("path", ""),
+                        "timestamp": r.get("timestamp", ""),
+                        "match": r.get("match", True),
+                        "responses": self._serializable_responses(r.get("responses", {}))
+                    }, separators=compact))
+                f.write("]}\n")
             
-            self._log("Session saved to " + filepath + " (" + str(self.results.size()) + " results)")
+            self._log("Session saved to " + filepath + " (" + str(len(results)) + " results)")
             JOptionPane.showMessageDialog(
                 self._main_panel,
-                "Saved {} results to:\n{}".format(self.results.size(), filepath)
+                "Saved {} results to:\n{}".format(len(results), filepath)
             )
         
         except Exception as e:
@@ -786,18 +1011,19 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
             
             filepath = chooser.getSelectedFile().getAbsolutePath()
             
-            with open(filepath, "r") as f:
-                session_data = json.load(f)
+            session_data = json.loads(self._read_text_file(filepath))
             
             # Validate format
             if "results" not in session_data:
                 raise ValueError("Invalid session file format")
             
             # Ask about merge vs replace
-            if self.results.size() > 0:
+            replace = False
+            existing = self.results.size()
+            if existing > 0:
                 choice = JOptionPane.showOptionDialog(
                     self._main_panel,
-                    "You have {} existing results. What would you like to do?".format(self.results.size()),
+                    "You have {} existing results. What would you like to do?".format(existing),
                     "Load Session",
                     JOptionPane.YES_NO_CANCEL_OPTION,
                     JOptionPane.QUESTION_MESSAGE,
@@ -809,27 +1035,49 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
                 if choice == 2 or choice == JOptionPane.CLOSED_OPTION:  # Cancel
                     return
                 elif choice == 1:  # Replace
-                    with self.results_lock:
-                        self.results.clear()
-            
-            # Load results
-            loaded_count = 0
-            with self.results_lock:
-                for r in session_data["results"]:
-                    # Respect max results limit
-                    if self.results.size() >= self._max_results:
-                        self._log("WARNING: Max results limit reached during import (" + str(self._max_results) + ")")
-                        break
-                    self.results.add({
-                        "method": r.get("method", ""),
-                        "path": r.get("path", ""),
-                        "timestamp": r.get("timestamp", ""),
-                        "match": r.get("match", True),
-                        "responses": r.get("responses", {})
-                    })
-                    loaded_count += 1
+                    replace = True
+            
+            # Build the records first, then swap them in under one lock hold
+            # so the table sees a single change instead of one per result
+            room = self._max_results - (0 if replace else self.results.size())
+            saved = session_data["results"]
+            if len(saved) > room:
+                self._log("WARNING: Max results limit reached during import (" + str(self._max_results) + ")")
+            # Saved records already have the result schema - reuse the dicts
+            # (readers all use .get() defaults), only the responses need rebuilding
+            records = saved[:max(room, 0)]
+            if session_data.get("version") == "5.0":
+                # Written by _save_session - every record has all keys, trust the shape
+                for r in records:
+                    r["responses"] = dict(
+                        (domain, ResponseRecord.from_json(data))
+                        for domain, data in r["responses"].items())
+            else:
+                # Unknown writer - validate each record
+                records = [r for r in records if isinstance(r, dict)]
+                for r in records:
+                    r.setdefault("match", True)
+                    responses = r.get("responses")
+                    r["responses"] = dict(
+                        (domain, ResponseRecord.from_json(data))
+                        for domain, data in (responses.items() if isinstance(responses, dict) else [])
+                        if isinstance(data, dict))
+            loaded_count = len(records)
             
-            self._results_model.fireTableDataChanged()
+            self._results_write_lock.lock()
+            try:
+                # sync() publishes an unchanged generation as row events for the
+                # evicted head and appended tail; a replace bumps it so the
+                # table gets a full data change
+                if replace:
+                    self.results.clear()
+                    self._results_generation += 1
+                for record in records:
+                    self.results.add(record)
+            finally:
+                self._results_write_lock.unlock()
+            
+            self._results_model.sync()
             self._update_results_count()
             
             version = session_data.get("version", "unknown")
@@ -845,6 +1093,18 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
             self._log("Load session error: " + str(e))
             JOptionPane.showMessageDialog(self._main_panel, "Error loading session: " + str(e))
     
+    def _read_text_file(self, filepath):
+        """Read a UTF-8 text file - files over 64KB go through one NIO read and a JVM decode"""
+        # Jython's file layer builds the string piecewise and leaves UTF-8
+        # decoding to the json parser; a single contiguous read decoded by the
+        # JVM's intrinsic decoder avoids both. Below ~64KB the extra Java
+        # round-trips cost more than they save, so small files stay on open()
+        if java.io.File(filepath).length() > 64 * 1024:
+            data = java.nio.file.Files.readAllBytes(java.nio.file.Paths.get(filepath))
+            return java.lang.String(data, java.nio.charset.StandardCharsets.UTF_8)
+        with open(filepath, "r") as f:
+            return f.read()
+    
     def _build_side_by_side_panel(self):
         """Build side-by-side comparison panel with synchronized scrolling"""
         panel = JPanel(BorderLayout())
@@ -887,6 +1147,7 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         self._right_response_area.setFont(Font("Monospaced", Font.PLAIN, 10))
         self._right_scroll_pane = JScrollPane(self._right_response_area)
         right_panel.add(self._right_scroll_pane)
+        self._side_by_side_styles = self._build_side_by_side_styles()
         
         # Set up synchronized scrolling
         self._scroll_sync_active = False  # Flag to prevent recursive updates
@@ -897,103 +1158,43 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         left_hbar = self._left_scroll_pane.getHorizontalScrollBar()
         right_hbar = self._right_scroll_pane.getHorizontalScrollBar()
         
-        # Create adjustment listeners for synchronized scrolling
-        def sync_left_to_right_v(e):
-            if self._scroll_sync_active:
-                return
-            if self._sync_scroll_checkbox.isSelected():
-                self._scroll_sync_active = True
-                try:
+        # Scroll sync is coalesced: listeners only record which bar moved, and a
+        # one-frame (16ms) timer copies the latest relative position across
+        self._scroll_sync_pending = {}  # axis -> (source_bar, target_bar)
+        
+        def apply_pending_sync(e):
+            pending = self._scroll_sync_pending
+            self._scroll_sync_pending = {}
+            self._scroll_sync_active = True
+            try:
+                for source, target in pending.values():
                     # Calculate relative position
-                    left_max = left_vbar.getMaximum() - left_vbar.getVisibleAmount()
-                    right_max = right_vbar.getMaximum() - right_vbar.getVisibleAmount()
-                    if left_max > 0 and right_max > 0:
-                        ratio = float(left_vbar.getValue()) / float(left_max)
-                        right_vbar.setValue(int(ratio * right_max))
-                    elif left_max <= 0:
-                        right_vbar.setValue(0)
-                finally:
-                    self._scroll_sync_active = False
-        
-        def sync_right_to_left_v(e):
-            if self._scroll_sync_active:
-                return
-            if self._sync_scroll_checkbox.isSelected():
-                self._scroll_sync_active = True
-                try:
-                    left_max = left_vbar.getMaximum() - left_vbar.getVisibleAmount()
-                    right_max = right_vbar.getMaximum() - right_vbar.getVisibleAmount()
-                    if right_max > 0 and left_max > 0:
-                        ratio = float(right_vbar.getValue()) / float(right_max)
-                        left_vbar.setValue(int(ratio * left_max))
-                    elif right_max <= 0:
-                        left_vbar.setValue(0)
-                finally:
-                    self._scroll_sync_active = False
-        
-        def sync_left_to_right_h(e):
-            if self._scroll_sync_active:
-                return
-            if self._sync_scroll_checkbox.isSelected():
-                self._scroll_sync_active = True
-                try:
-                    left_max = left_hbar.getMaximum() - left_hbar.getVisibleAmount()
-                    right_max = right_hbar.getMaximum() - right_hbar.getVisibleAmount()
-                    if left_max > 0 and right_max > 0:
-                        ratio = float(left_hbar.getValue()) / float(left_max)
-                        right_hbar.setValue(int(ratio * right_max))
-                    elif left_max <= 0:
-                        right_hbar.setValue(0)
-                finally:
-                    self._scroll_sync_active = False
-        
-        def sync_right_to_left_h(e):
-            if self._scroll_sync_active:
+                    source_max = source.getMaximum() - source.getVisibleAmount()
+                    target_max = target.getMaximum() - target.getVisibleAmount()
+                    if source_max > 0 and target_max > 0:
+                        ratio = float(source.getValue()) / float(source_max)
+                        target.setValue(int(ratio * target_max))
+                    elif source_max <= 0:
+                        target.setValue(0)
+            finally:
+                self._scroll_sync_active = False
+        
+        self._scroll_sync_timer = Timer(16, apply_pending_sync)
+        self._scroll_sync_timer.setRepeats(False)
+        
+        def schedule_sync(axis, source, target):
+            # Ignore the events our own setValue calls trigger
+            if self._scroll_sync_active or not self._sync_scroll_checkbox.isSelected():
                 return
-            if self._sync_scroll_checkbox.isSelected():
-                self._scroll_sync_active = True
-                try:
-                    left_max = left_hbar.getMaximum() - left_hbar.getVisibleAmount()
-                    right_max = right_hbar.getMaximum() - right_hbar.getVisibleAmount()
-                    if right_max > 0 and left_max > 0:
-                        ratio = float(right_hbar.getValue()) / float(right_max)
-                        left_hbar.setValue(int(ratio * left_max))
-                    elif right_max <= 0:
-                        left_hbar.setValue(0)
-                finally:
-                    self._scroll_sync_active = False
+            self._scroll_sync_pending[axis] = (source, target)
+            if not self._scroll_sync_timer.isRunning():
+                self._scroll_sync_timer.start()
         
         # Add the listeners
-        from java.awt.event import AdjustmentListener
-        
-        class LeftVScrollListener(AdjustmentListener):
-            def __init__(self, callback):
-                self.callback = callback
-            def adjustmentValueChanged(self, e):
-                self.callback(e)
-        
-        class RightVScrollListener(AdjustmentListener):
-            def __init__(self, callback):
-                self.callback = callback
-            def adjustmentValueChanged(self, e):
-                self.callback(e)
-        
-        class LeftHScrollListener(AdjustmentListener):
-            def __init__(self, callback):
-                self.callback = callback
-            def adjustmentValueChanged(self, e):
-                self.callback(e)
-        
-        class RightHScrollListener(AdjustmentListener):
-            def __init__(self, callback):
-                self.callback = callback
-            def adjustmentValueChanged(self, e):
-                self.callback(e)
-        
-        left_vbar.addAdjustmentListener(LeftVScrollListener(sync_left_to_right_v))
-        right_vbar.addAdjustmentListener(RightVScrollListener(sync_right_to_left_v))
-        left_hbar.addAdjustmentListener(LeftHScrollListener(sync_left_to_right_h))
-        right_hbar.addAdjustmentListener(RightHScrollListener(sync_right_to_left_h))
+        left_vbar.addAdjustmentListener(AdjustmentCallback(lambda e: schedule_sync("v", left_vbar, right_vbar)))
+        right_vbar.addAdjustmentListener(AdjustmentCallback(lambda e: schedule_sync("v", right_vbar, left_vbar)))
+        left_hbar.addAdjustmentListener(AdjustmentCallback(lambda e: schedule_sync("h", left_hbar, right_hbar)))
+        right_hbar.addAdjustmentListener(AdjustmentCallback(lambda e: schedule_sync("h", right_hbar, left_hbar)))
         
         split.setLeftComponent(left_panel)
         split.setRightComponent(right_panel)
@@ -1005,17 +1206,24 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
     
     def _get_body_limit(self):
         """Get current body display limit"""
-        if not hasattr(self, '_body_limit_combo'):
-            return None
+        return self._body_limit_cached
+    
+    def _recompute_body_limit(self):
+        """Parse the body limit combo selection once and cache it"""
         selected = self._body_limit_combo.getSelectedItem()
         if "500" in selected:
-            return 500
+            self._body_limit_cached = 500
         elif "2000" in selected:
-            return 2000
+            self._body_limit_cached = 2000
         elif "5000" in selected:
-            return 5000
+            self._body_limit_cached = 5000
         else:
-            return None  # No limit
+            self._body_limit_cached = None  # No limit
+    
+    def _on_body_limit_changed(self):
+        """Re-cache the body limit, then re-render the selected result"""
+        self._recompute_body_limit()
+        self._on_result_selected()
     
     def _on_result_selected(self):
         """Handle result selection - populate all comparison views"""
@@ -1023,37 +1231,34 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         if view_row < 0:
             return
         
-        # Convert view row to model row (important when table is sorted!)
-        model_row = view_row
-        if hasattr(self, '_results_sorter') and self._results_sorter:
-            try:
-                model_row = self._results_table.convertRowIndexToModel(view_row)
-            except:
-                pass  # Fall back to view_row if conversion fails
-        
-        # Get actual index after filtering
-        filter_val = self._filter_combo.getSelectedItem()
-        actual_idx = self._get_filtered_result_index(model_row, filter_val)
-        
-        if actual_idx < 0 or actual_idx >= self.results.size():
+        # Convert view row to model row (important when table is sorted or filtered!)
+        try:
+            actual_idx = self._results_table.convertRowIndexToModel(view_row)
+        except:
             return
         
-        result = self.results.get(actual_idx)
+        self._results_read_lock.lock()
+        try:
+            if actual_idx < 0 or actual_idx >= self.results.size():
+                return
+            result = self.results.get(actual_idx)
+        finally:
+            self._results_read_lock.unlock()
         self._current_result = result
         
         responses = result.get("responses", {})
         domains = list(responses.keys())
         body_limit = self._get_body_limit()
         
-        # Update domain selectors
-        self._response_selector.removeAllItems()
-        self._left_domain_combo.removeAllItems()
-        self._right_domain_combo.removeAllItems()
+        # Update domain selectors - one model swap per combo instead of an event per item
+        # (each combo needs its own model since the model holds the selection)
+        domain_items = array(domains, java.lang.String)
+        self._response_selector.setModel(DefaultComboBoxModel(domain_items))
+        self._left_domain_combo.setModel(DefaultComboBoxModel(domain_items))
+        self._right_domain_combo.setModel(DefaultComboBoxModel(domain_items))
         
-        for domain in domains:
-            self._response_selector.addItem(domain)
-            self._left_domain_combo.addItem(domain)
-            self._right_domain_combo.addItem(domain)
+        # setModel fires no action event, so show the preselected first domain here
+        self._show_selected_response()
         
         if len(domains) >= 2:
             self._left_domain_combo.setSelectedIndex(0)
@@ -1072,12 +1277,7 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         text += "-" * 70 + "\n"
         
         for domain, data in responses.items():
-            text += "{:<30} {:>8} {:>10} {:>15}\n".format(
-                domain[:30],
-                str(data.get("status", "?")),
-                str(data.get("size", 0)),
-                data.get("hash", "")[:15]
-            )
+            text += "{:<30} ".format(domain[:30]) + data.summary_row + "\n"
         
         # Show truncated bodies if mismatch
         if not result.get("match"):
@@ -1086,13 +1286,15 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
             text += "(See 'Diff View' tab for detailed comparison)\n"
             text += "=" * 70 + "\n"
             
+            sb = java.lang.StringBuilder(text)
             for domain, data in responses.items():
-                text += "\n--- " + domain + " [" + str(data.get("status", "?")) + "] ---\n"
-                body = data.get("body", "")
+                sb.append("\n--- ").append(domain).append(" [").append(data.summary[0]).append("] ---\n")
+                body = self._response_body(data)
                 if body_limit and len(body) > body_limit:
-                    text += body[:body_limit] + "\n... [truncated, " + str(len(body)) + " total chars]\n"
+                    sb.append(body, 0, body_limit).append("\n... [truncated, ").append(str(len(body))).append(" total chars]\n")
                 else:
-                    text += body + "\n"
+                    sb.append(body).append("\n")
+            text = sb.toString()
         
         self._response_area.setText(text)
         
@@ -1100,164 +1302,318 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         # Show loading indicator immediately
         self._diff_area.setText("Loading diff... (large responses may take a moment)")
         
-        # Process in background thread
+        # Process in background, replacing any diff still pending for an older selection
         def compute_diff():
             self._update_diff_view(result, responses, domains)
         
-        t = Thread(target=compute_diff)
-        t.daemon = True
-        t.start()
+        self._diff_future = self._submit_view_job(self._diff_exec, self._diff_future, compute_diff)
         
         # === SIDE BY SIDE (heavy - do in background) ===
         # Show loading indicator immediately
         self._left_response_area.setText("Loading...")
         self._right_response_area.setText("Loading...")
         
-        def compute_side_by_side():
-            self._update_side_by_side()
+        self._sbs_future = self._submit_view_job(self._sbs_exec, self._sbs_future, self._update_side_by_side)
+    
+    def _build_diff_styles(self):
+        """Create the diff view text styles once - reused for every render"""
+        # Private context so the named styles never touch Burp's shared default one
+        style_context = StyleContext()
+        
+        styles = {}
+        styles["normal"] = style_context.addStyle("normal", None)
+        StyleConstants.setFontFamily(styles["normal"], "Monospaced")
+        StyleConstants.setFontSize(styles["normal"], 11)
+        
+        styles["header"] = style_context.addStyle("header", None)
+        StyleConstants.setFontFamily(styles["header"], "Monospaced")
+        StyleConstants.setFontSize(styles["header"], 11)
+        StyleConstants.setBold(styles["header"], True)
+        StyleConstants.setForeground(styles["header"], Color(0, 0, 150))
+        
+        styles["added"] = style_context.addStyle("added", None)
+        StyleConstants.setFontFamily(styles["added"], "Monospaced")
+        StyleConstants.setFontSize(styles["added"], 11)
+        StyleConstants.setBackground(styles["added"], Color(200, 255, 200))
+        StyleConstants.setForeground(styles["added"], Color(0, 100, 0))
+        
+        styles["removed"] = style_context.addStyle("removed", None)
+        StyleConstants.setFontFamily(styles["removed"], "Monospaced")
+        StyleConstants.setFontSize(styles["removed"], 11)
+        StyleConstants.setBackground(styles["removed"], Color(255, 200, 200))
+        StyleConstants.setForeground(styles["removed"], Color(150, 0, 0))
+        
+        # Changed characters within a modified line
+        styles["added_char"] = style_context.addStyle("added_char", styles["added"])
+        StyleConstants.setBackground(styles["added_char"], Color(120, 220, 120))
+        StyleConstants.setBold(styles["added_char"], True)
+        
+        styles["removed_char"] = style_context.addStyle("removed_char", styles["removed"])
+        StyleConstants.setBackground(styles["removed_char"], Color(240, 140, 140))
+        StyleConstants.setBold(styles["removed_char"], True)
+        
+        styles["separator"] = style_context.addStyle("separator", None)
+        StyleConstants.setFontFamily(styles["separator"], "Monospaced")
+        StyleConstants.setFontSize(styles["separator"], 11)
+        StyleConstants.setForeground(styles["separator"], Color(100, 100, 100))
+        
+        return styles
+    
+    def _build_side_by_side_styles(self):
+        """Create the side-by-side text styles once - reused for every render"""
+        # Private context so the named styles never touch Burp's shared default one
+        style_context = StyleContext()
+        
+        styles = {}
+        styles["normal"] = style_context.addStyle("normal", None)
+        StyleConstants.setFontFamily(styles["normal"], "Monospaced")
+        StyleConstants.setFontSize(styles["normal"], 10)
+        
+        styles["diff"] = style_context.addStyle("diff", None)
+        StyleConstants.setFontFamily(styles["diff"], "Monospaced")
+        StyleConstants.setFontSize(styles["diff"], 10)
+        StyleConstants.setBackground(styles["diff"], Color(255, 255, 150))
+        
+        styles["header"] = style_context.addStyle("header", None)
+        StyleConstants.setFontFamily(styles["header"], "Monospaced")
+        StyleConstants.setFontSize(styles["header"], 10)
+        StyleConstants.setBold(styles["header"], True)
+        
+        return styles
+    
+    def _line_ids(self, a_lines, b_lines):
+        """Map each distinct line to a small int so the matcher compares ints, not strings"""
+        ids = {}
+        a_ids = [ids.setdefault(line, len(ids)) for line in a_lines]
+        b_ids = [ids.setdefault(line, len(ids)) for line in b_lines]
+        return a_ids, b_ids
+    
+    def _unified_diff(self, a, b, fromfile, tofile, context=3):
+        """Lazily yield unified diff lines (no line terminators), like
+        difflib.unified_diff but matching on interned line ids"""
+        def format_range(start, stop):
+            beginning = start + 1
+            length = stop - start
+            if length == 1:
+                return str(beginning)
+            if not length:
+                beginning -= 1
+            return "{},{}".format(beginning, length)
+        
+        a_ids, b_ids = self._line_ids(a, b)
+        matcher = TrimmedSequenceMatcher(None, a_ids, b_ids)
+        started = False
+        for group in matcher.get_grouped_opcodes(context):
+            if not started:
+                started = True
+                yield "--- " + fromfile
+                yield "+++ " + tofile
+            first, last = group[0], group[-1]
+            yield "@@ -{} +{} @@".format(format_range(first[1], last[2]), format_range(first[3], last[4]))
+            for tag, i1, i2, j1, j2 in group:
+                if tag == 'equal':
+                    for line in a[i1:i2]:
+                        yield " " + line
+                    continue
+                if tag in ('replace', 'delete'):
+                    for line in a[i1:i2]:
+                        yield "-" + line
+                if tag in ('replace', 'insert'):
+                    for line in b[j1:j2]:
+                        yield "+" + line
+    
+    def _render_unified_diff(self, primary_domain, primary_data, primary_body, other_domain, other_data, other_body):
+        """Render a styled unified diff for one body pair, reusing cached renders"""
+        # The stored body hash plus the (possibly truncated) length identifies
+        # the text without re-hashing it; records without a hash key on the text
+        key = (
+            (primary_data.hash, len(primary_body)) if primary_data.hash else primary_body,
+            (other_data.hash, len(other_body)) if other_data.hash else other_body,
+            primary_domain, other_domain, self._max_diff_lines
+        )
+        with self._diff_cache_lock:
+            rendered = self._diff_cache.pop(key, None)
+            if rendered is not None:
+                self._diff_cache[key] = rendered  # Re-insert as most recent
+                return rendered
+        
+        rendered = StyledTextBuffer()
+        # Generate unified diff lazily - only the lines we display are computed
+        diff = self._unified_diff(
+            primary_body.splitlines(),
+            other_body.splitlines(),
+            primary_domain,
+            other_domain
+        )
+        
+        lines = []
+        truncated = False
+        for line in diff:
+            if len(lines) >= self._max_diff_lines:
+                truncated = True
+                break
+            lines.append(line)
         
-        t2 = Thread(target=compute_side_by_side)
-        t2.daemon = True
-        t2.start()
+        if lines:
+            rendered.write("UNIFIED DIFF:\n", "header")
+        else:
+            rendered.write("Body content is identical (difference may be in headers)\n", "normal")
+        
+        i = 0
+        while i < len(lines):
+            line = lines[i]
+            if line.startswith('+++') or line.startswith('---'):
+                rendered.write_line(line, "header")
+            elif line.startswith('@@'):
+                rendered.write_line(line, "separator")
+            elif line.startswith('-'):
+                # A run of removed lines followed by added lines is a change
+                # block; pair them up for character-level highlighting
+                j = i
+                while j < len(lines) and lines[j].startswith('-'):
+                    j += 1
+                k = j
+                while k < len(lines) and lines[k].startswith('+'):
+                    k += 1
+                removed, added = lines[i:j], lines[j:k]
+                added_segments = []
+                for n, old_line in enumerate(removed):
+                    pair = self._intraline_segments(old_line, added[n]) if n < len(added) else None
+                    if pair:
+                        rendered.write_segments(pair[0])
+                        added_segments.append(pair[1])
+                    else:
+                        rendered.write_line(old_line, "removed")
+                        if n < len(added):
+                            added_segments.append([(added[n] + "\n", "added")])
+                for segments in added_segments:
+                    rendered.write_segments(segments)
+                for new_line in added[len(removed):]:
+                    rendered.write_line(new_line, "added")
+                i = k
+                continue
+            elif line.startswith('+'):
+                rendered.write_line(line, "added")
+            else:
+                rendered.write_line(line, "normal")
+            i += 1
+        
+        if truncated:
+            rendered.write(
+                "\n... [diff truncated, showing first {} lines]\n".format(self._max_diff_lines), 
+                "separator"
+            )
+        
+        with self._diff_cache_lock:
+            self._diff_cache[key] = rendered
+            while len(self._diff_cache) > self._diff_cache_size:
+                self._diff_cache.popitem(last=False)
+        return rendered
+    
+    def _intraline_segments(self, old_line, new_line):
+        """Split a changed -/+ line pair into styled runs highlighting the changed characters.
+        Returns (old_segments, new_segments), or None when the lines are too dissimilar or long."""
+        a = old_line[1:]
+        b = new_line[1:]
+        shorter, longer = min(len(a), len(b)), max(len(a), len(b))
+        if not shorter or longer > 4 * shorter or longer > 2000:
+            return None
+        
+        old_segments = [("-", "removed")]
+        new_segments = [("+", "added")]
+        for tag, i1, i2, j1, j2 in TrimmedSequenceMatcher(None, a, b).get_opcodes():
+            if tag == 'equal':
+                old_segments.append((a[i1:i2], "removed"))
+                new_segments.append((b[j1:j2], "added"))
+            else:
+                if i2 > i1:
+                    old_segments.append((a[i1:i2], "removed_char"))
+                if j2 > j1:
+                    new_segments.append((b[j1:j2], "added_char"))
+        old_segments.append(("\n", "removed"))
+        new_segments.append(("\n", "added"))
+        return (old_segments, new_segments)
     
     def _update_diff_view(self, result, responses, domains):
         """Update the diff view with highlighted differences - runs in background thread"""
         try:
-            # Pre-compute all the diff content in background thread
-            diff_content = []  # List of (text, style_name) tuples
+            # Pre-compute all the diff content in background thread, as one
+            # text buffer plus its style runs
+            diff_content = StyledTextBuffer()
             
             if result.get("match"):
-                diff_content.append(("All responses are IDENTICAL\n\n", "header"))
-                diff_content.append(("Hash: " + list(responses.values())[0].get("hash", ""), "normal"))
+                diff_content.write("All responses are IDENTICAL\n\n", "header")
+                diff_content.write("Hash: " + list(responses.values())[0].hash, "normal")
             else:
-                diff_content.append(("DIFFERENCES DETECTED\n", "header"))
-                diff_content.append(("=" * 70 + "\n\n", "separator"))
+                diff_content.write("DIFFERENCES DETECTED\n", "header")
+                diff_content.write("=" * 70 + "\n\n", "separator")
                 
                 # Compare each pair of responses
                 if len(domains) >= 2:
                     primary_domain = domains[0]
                     primary_data = responses[primary_domain]
-                    primary_body = primary_data.get("body", "")
+                    primary_body = self._response_body(primary_data)
                     
                     # Limit body size for diff calculation to prevent massive memory usage
                     max_diff_body_size = 100000  # 100KB limit for diff calculation
                     if len(primary_body) > max_diff_body_size:
                         primary_body = primary_body[:max_diff_body_size]
-                        diff_content.append(("WARNING: Primary body truncated to {}KB for diff\n\n".format(max_diff_body_size // 1000), "separator"))
+                        diff_content.write("WARNING: Primary body truncated to {}KB for diff\n\n".format(max_diff_body_size // 1000), "separator")
                     
                     for other_domain in domains[1:]:
                         other_data = responses[other_domain]
-                        other_body = other_data.get("body", "")
+                        other_body = self._response_body(other_data)
                         
                         if len(other_body) > max_diff_body_size:
                             other_body = other_body[:max_diff_body_size]
                         
-                        diff_content.append(("Comparing: {} vs {}\n".format(primary_domain, other_domain), "header"))
-                        diff_content.append(("-" * 70 + "\n", "separator"))
+                        diff_content.write("Comparing: {} vs {}\n".format(primary_domain, other_domain), "header")
+                        diff_content.write("-" * 70 + "\n", "separator")
                         
                         # Status comparison
-                        if primary_data.get("status") != other_data.get("status"):
-                            diff_content.append(("Status: ", "normal"))
-                            diff_content.append((str(primary_data.get("status")), "removed"))
-                            diff_content.append((" vs ", "normal"))
-                            diff_content.append((str(other_data.get("status")), "added"))
-                            diff_content.append(("\n", "normal"))
+                        if primary_data.status != other_data.status:
+                            diff_content.write("Status: ", "normal")
+                            diff_content.write(primary_data.summary[0], "removed")
+                            diff_content.write(" vs ", "normal")
+                            diff_content.write(other_data.summary[0], "added")
+                            diff_content.write("\n", "normal")
                         
                         # Size comparison
-                        if primary_data.get("size") != other_data.get("size"):
-                            diff_content.append(("Size: ", "normal"))
-                            diff_content.append((str(primary_data.get("size")), "removed"))
-                            diff_content.append((" vs ", "normal"))
-                            diff_content.append((str(other_data.get("size")), "added"))
-                            diff_content.append(("\n", "normal"))
+                        if primary_data.size != other_data.size:
+                            diff_content.write("Size: ", "normal")
+                            diff_content.write(primary_data.summary[1], "removed")
+                            diff_content.write(" vs ", "normal")
+                            diff_content.write(other_data.summary[1], "added")
+                            diff_content.write("\n", "normal")
                         
-                        diff_content.append(("\n", "normal"))
+                        diff_content.write("\n", "normal")
                         
-                        # Generate unified diff
-                        primary_lines = primary_body.splitlines(keepends=True)
-                        other_lines = other_body.splitlines(keepends=True)
-                        
-                        diff = list(difflib.unified_diff(
-                            primary_lines, 
-                            other_lines,
-                            fromfile=primary_domain,
-                            tofile=other_domain,
-                            lineterm=''
-                        ))
-                        
-                        if diff:
-                            diff_content.append(("UNIFIED DIFF:\n", "header"))
-                            
-                            diff_line_count = 0
-                            
-                            for line in diff:
-                                if diff_line_count >= self._max_diff_lines:
-                                    diff_content.append((
-                                        "\n... [diff truncated, showing first {} lines]\n".format(self._max_diff_lines), 
-                                        "separator"
-                                    ))
-                                    break
-                                
-                                if line.startswith('+++') or line.startswith('---'):
-                                    diff_content.append((line + "\n", "header"))
-                                elif line.startswith('@@'):
-                                    diff_content.append((line + "\n", "separator"))
-                                elif line.startswith('+'):
-                                    diff_content.append((line + "\n", "added"))
-                                elif line.startswith('-'):
-                                    diff_content.append((line + "\n", "removed"))
-                                else:
-                                    diff_content.append((line + "\n", "normal"))
-                                
-                                diff_line_count += 1
+                        # Equal bodies need no splitlines/diff work at all
+                        if self._same_body(other_data, primary_data):
+                            diff_content.write("Body content is identical (difference may be in headers)\n", "normal")
+                        elif other_body == primary_body:
+                            diff_content.write("Body content is identical in the first {}KB (differences are beyond the diff limit)\n".format(
+                                max_diff_body_size // 1000), "normal")
                         else:
-                            diff_content.append(("Body content is identical (difference may be in headers)\n", "normal"))
+                            diff_content.write_buffer(self._render_unified_diff(
+                                primary_domain, primary_data, primary_body,
+                                other_domain, other_data, other_body))
                         
-                        diff_content.append(("\n" + "=" * 70 + "\n\n", "separator"))
+                        diff_content.write("\n" + "=" * 70 + "\n\n", "separator")
+            
+            # Fill a detached document here so the EDT only has to swap it in
+            diff_doc = self._build_styled_document(diff_content, self._diff_styles)
             
             # Now update UI on EDT
             def update_ui():
                 try:
-                    doc = self._diff_area.getStyledDocument()
-                    doc.remove(0, doc.getLength())
-                    
-                    # Define styles
-                    style_context = StyleContext.getDefaultStyleContext()
-                    
-                    styles = {}
-                    styles["normal"] = style_context.addStyle("normal", None)
-                    StyleConstants.setFontFamily(styles["normal"], "Monospaced")
-                    StyleConstants.setFontSize(styles["normal"], 11)
-                    
-                    styles["header"] = style_context.addStyle("header", None)
-                    StyleConstants.setFontFamily(styles["header"], "Monospaced")
-                    StyleConstants.setFontSize(styles["header"], 11)
-                    StyleConstants.setBold(styles["header"], True)
-                    StyleConstants.setForeground(styles["header"], Color(0, 0, 150))
-                    
-                    styles["added"] = style_context.addStyle("added", None)
-                    StyleConstants.setFontFamily(styles["added"], "Monospaced")
-                    StyleConstants.setFontSize(styles["added"], 11)
-                    StyleConstants.setBackground(styles["added"], Color(200, 255, 200))
-                    StyleConstants.setForeground(styles["added"], Color(0, 100, 0))
-                    
-                    styles["removed"] = style_context.addStyle("removed", None)
-                    StyleConstants.setFontFamily(styles["removed"], "Monospaced")
-                    StyleConstants.setFontSize(styles["removed"], 11)
-                    StyleConstants.setBackground(styles["removed"], Color(255, 200, 200))
-                    StyleConstants.setForeground(styles["removed"], Color(150, 0, 0))
-                    
-                    styles["separator"] = style_context.addStyle("separator", None)
-                    StyleConstants.setFontFamily(styles["separator"], "Monospaced")
-                    StyleConstants.setFontSize(styles["separator"], 11)
-                    StyleConstants.setForeground(styles["separator"], Color(100, 100, 100))
-                    
-                    # Apply pre-computed content
-                    for text, style_name in diff_content:
-                        doc.insertString(doc.getLength(), text, styles.get(style_name, styles["normal"]))
+                    self._diff_area.setStyledDocument(diff_doc)
                 except Exception as e:
-                    self._debug_print("Error updating diff UI: " + str(e))
+                    self._debug_print("Error updating diff UI: %s", e)
             
+            # Cancelled by a newer selection - its render supersedes this one
+            if java.lang.Thread.currentThread().isInterrupted():
+                return
             SwingUtilities.invokeLater(update_ui)
             
         except Exception as e:
@@ -1265,6 +1621,19 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
                 self._diff_area.setText("Error computing diff: " + str(e))
             SwingUtilities.invokeLater(show_error)
     
+    def _build_styled_document(self, content, styles):
+        """Build a new document from a StyledTextBuffer - one insert, then the
+        non-normal runs styled. Safe off the EDT, as nothing renders the
+        document until it is attached to a text pane."""
+        doc = DefaultStyledDocument()
+        doc.insertString(0, content.text(), styles["normal"])
+        offset = 0
+        for style_name, length in content.runs():
+            if style_name != "normal":
+                doc.setCharacterAttributes(offset, length, styles.get(style_name, styles["normal"]), True)
+            offset += length
+        return doc
+    
     def _show_selected_response(self):
         """Show the full response for selected domain"""
         if not self._current_result:
@@ -1277,16 +1646,20 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         responses = self._current_result.get("responses", {})
         if selected in responses:
             data = responses[selected]
-            body = data.get("body", "")
+            body = self._response_body(data)
             
             text = "Domain: " + selected + "\n"
-            text += "Status: " + str(data.get("status", "?")) + "\n"
-            text += "Size: " + str(data.get("size", 0)) + " bytes\n"
-            text += "Hash: " + data.get("hash", "") + "\n"
+            status, size, body_hash = data.summary
+            text += "Status: " + status + "\n"
+            text += "Size: " + size + " bytes\n"
+            text += "Hash: " + body_hash + "\n"
             text += "=" * 60 + "\n\n"
-            text += body
             
-            self._full_body_area.setText(text)
+            # Insert header and body separately rather than concatenating the body
+            doc = self._full_body_area.getDocument()
+            doc.remove(0, doc.getLength())
+            doc.insertString(0, text, None)
+            doc.insertString(doc.getLength(), body, None)
             self._full_body_area.setCaretPosition(0)
     
     def _trigger_side_by_side_update(self):
@@ -1296,12 +1669,13 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         self._right_response_area.setText("Loading...")
         
         # Run update in background
-        def do_update():
-            self._update_side_by_side()
-        
-        t = Thread(target=do_update)
-        t.daemon = True
-        t.start()
+        self._sbs_future = self._submit_view_job(self._sbs_exec, self._sbs_future, self._update_side_by_side)
+    
+    def _submit_view_job(self, executor, previous, fn):
+        """Cancel a view's previous render job and queue fn - returns the new Future"""
+        if previous is not None:
+            previous.cancel(True)
+        return executor.submit(CallableTask(fn))
     
     def _update_side_by_side(self):
         """Update side-by-side comparison view with highlighting - runs in background thread"""
@@ -1318,11 +1692,16 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
             
             responses = self._current_result.get("responses", {})
             
-            left_data = responses.get(left_domain, {})
-            right_data = responses.get(right_domain, {})
+            left_data = responses.get(left_domain)
+            right_data = responses.get(right_domain)
+            if left_data is None or right_data is None:
+                return  # Combos still hold a previous result's domains
             
-            left_body = left_data.get("body", "")
-            right_body = right_data.get("body", "")
+            # Equal hashes mean equal bodies - decide that before touching the
+            # bodies, and reuse the left text rather than decoding the right
+            identical = self._same_body(left_data, right_data)
+            left_body = self._response_body(left_data)
+            right_body = left_body if identical else self._response_body(right_data)
             
             # Limit body size for comparison to prevent freezing
             max_side_by_side_size = 50000  # 50KB limit for side-by-side
@@ -1337,104 +1716,117 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
                 right_truncated = True
             
             # Build headers
-            left_header = "Status: {} | Size: {} | Hash: {}\n{}\n".format(
-                left_data.get("status", "?"),
-                left_data.get("size", 0),
-                left_data.get("hash", "")[:12],
-                "=" * 40
-            )
+            left_header = left_data.header_line + "\n" + "=" * 40 + "\n"
             if left_truncated:
                 left_header += "(truncated to 50KB for display)\n"
             left_header += "\n"
             
-            right_header = "Status: {} | Size: {} | Hash: {}\n{}\n".format(
-                right_data.get("status", "?"),
-                right_data.get("size", 0),
-                right_data.get("hash", "")[:12],
-                "=" * 40
-            )
+            right_header = right_data.header_line + "\n" + "=" * 40 + "\n"
             if right_truncated:
                 right_header += "(truncated to 50KB for display)\n"
             right_header += "\n"
             
-            # Pre-compute the comparison in background
-            left_content = []  # (text, is_diff) tuples
-            right_content = []
+            # Pre-compute the comparison in background - one text buffer plus
+            # style runs per pane
+            left_content = StyledTextBuffer()
+            right_content = StyledTextBuffer()
             
-            left_content.append((left_header, False))
-            right_content.append((right_header, False))
+            left_content.write(left_header, "header")
+            right_content.write(right_header, "header")
             
-            # Split into lines and compare
-            left_lines = left_body.splitlines()
-            right_lines = right_body.splitlines()
+            if identical or left_body == right_body:
+                # Identical (after truncation) - nothing to highlight, so skip
+                # the line split and matcher and show each body as one run
+                left_content.write(left_body, "normal")
+                right_content.write(right_body, "normal")
+                opcodes = []
+                tail_text = ""
+            else:
+                # Split into lines and compare
+                left_lines = self._body_lines(left_data, left_body)
+                right_lines = self._body_lines(right_data, right_body)
+                
+                # Bodies from mirrored domains usually share long leading and
+                # trailing regions - emit those as one unhighlighted run each and
+                # only intern and match the lines in between
+                shorter = min(len(left_lines), len(right_lines))
+                head = 0
+                while head < shorter and left_lines[head] == right_lines[head]:
+                    head += 1
+                tail = 0
+                while tail < shorter - head and left_lines[-1 - tail] == right_lines[-1 - tail]:
+                    tail += 1
+                if head:
+                    head_text = "\n".join(left_lines[:head]) + "\n"
+                    left_content.write(head_text, "normal")
+                    right_content.write(head_text, "normal")
+                tail_text = "\n".join(left_lines[len(left_lines) - tail:]) + "\n" if tail else ""
+                left_lines = left_lines[head:len(left_lines) - tail]
+                right_lines = right_lines[head:len(right_lines) - tail]
+                
+                # Large compares collapse to hunks, which keeps them small
+                # without cutting them off; otherwise only match as many
+                # differing lines as the diff view would show
+                hunk_mode = max(len(left_lines), len(right_lines)) > SIDE_BY_SIDE_HUNK_LINES
+                max_lines = self._max_diff_lines
+                if not hunk_mode and (len(left_lines) > max_lines or len(right_lines) > max_lines):
+                    left_lines = left_lines[:max_lines]
+                    right_lines = right_lines[:max_lines]
+                    tail_text = "\n... [comparison truncated to {} lines after the first difference]\n".format(max_lines)
+                
+                # Find differences in the middle on interned line ids
+                left_ids, right_ids = self._line_ids(left_lines, right_lines)
+                matcher = TrimmedSequenceMatcher(None, left_ids, right_ids)
+                if hunk_mode:
+                    # Large compare - keep only unified-diff style hunks and
+                    # collapse the unchanged stretches between them
+                    opcodes = []
+                    shown = 0
+                    for group in matcher.get_grouped_opcodes(SIDE_BY_SIDE_CONTEXT):
+                        if group[0][1] > shown:
+                            opcodes.append(("skip", shown, group[0][1], 0, 0))
+                        opcodes.extend(group)
+                        shown = group[-1][2]
+                    if shown < len(left_lines):
+                        opcodes.append(("skip", shown, len(left_lines), 0, 0))
+                else:
+                    opcodes = matcher.get_opcodes()
             
-            # Use SequenceMatcher to find differences
-            matcher = difflib.SequenceMatcher(None, left_lines, right_lines)
+            # Each opcode covers a contiguous block, so write it as one run;
+            # delete/insert leave the other side's slice empty
+            for tag, i1, i2, j1, j2 in opcodes:
+                if tag == "skip":
+                    marker = "... [{} unchanged lines]\n".format(i2 - i1)
+                    left_content.write(marker, "header")
+                    right_content.write(marker, "header")
+                    continue
+                style_name = "normal" if tag == 'equal' else "diff"
+                left_content.write_lines(left_lines[i1:i2], style_name)
+                right_content.write_lines(right_lines[j1:j2], style_name)
             
-            for tag, i1, i2, j1, j2 in matcher.get_opcodes():
-                if tag == 'equal':
-                    for line in left_lines[i1:i2]:
-                        left_content.append((line + "\n", False))
-                    for line in right_lines[j1:j2]:
-                        right_content.append((line + "\n", False))
-                elif tag == 'replace':
-                    for line in left_lines[i1:i2]:
-                        left_content.append((line + "\n", True))
-                    for line in right_lines[j1:j2]:
-                        right_content.append((line + "\n", True))
-                elif tag == 'delete':
-                    for line in left_lines[i1:i2]:
-                        left_content.append((line + "\n", True))
-                elif tag == 'insert':
-                    for line in right_lines[j1:j2]:
-                        right_content.append((line + "\n", True))
+            if tail_text:
+                left_content.write(tail_text, "normal")
+                right_content.write(tail_text, "normal")
+            
+            # Fill detached documents here so the EDT only has to swap them in
+            left_doc = self._build_styled_document(left_content, self._side_by_side_styles)
+            right_doc = self._build_styled_document(right_content, self._side_by_side_styles)
             
             # Now update UI on EDT
             def update_ui():
                 try:
-                    left_doc = self._left_response_area.getStyledDocument()
-                    right_doc = self._right_response_area.getStyledDocument()
-                    
-                    left_doc.remove(0, left_doc.getLength())
-                    right_doc.remove(0, right_doc.getLength())
-                    
-                    # Define styles
-                    style_context = StyleContext.getDefaultStyleContext()
-                    
-                    normal_style = style_context.addStyle("normal", None)
-                    StyleConstants.setFontFamily(normal_style, "Monospaced")
-                    StyleConstants.setFontSize(normal_style, 10)
-                    
-                    diff_style = style_context.addStyle("diff", None)
-                    StyleConstants.setFontFamily(diff_style, "Monospaced")
-                    StyleConstants.setFontSize(diff_style, 10)
-                    StyleConstants.setBackground(diff_style, Color(255, 255, 150))
-                    
-                    header_style = style_context.addStyle("header", None)
-                    StyleConstants.setFontFamily(header_style, "Monospaced")
-                    StyleConstants.setFontSize(header_style, 10)
-                    StyleConstants.setBold(header_style, True)
-                    
-                    # Apply left content
-                    for i, (text, is_diff) in enumerate(left_content):
-                        if i == 0:  # Header
-                            left_doc.insertString(left_doc.getLength(), text, header_style)
-                        else:
-                            left_doc.insertString(left_doc.getLength(), text, diff_style if is_diff else normal_style)
-                    
-                    # Apply right content
-                    for i, (text, is_diff) in enumerate(right_content):
-                        if i == 0:  # Header
-                            right_doc.insertString(right_doc.getLength(), text, header_style)
-                        else:
-                            right_doc.insertString(right_doc.getLength(), text, diff_style if is_diff else normal_style)
+                    self._left_response_area.setStyledDocument(left_doc)
+                    self._right_response_area.setStyledDocument(right_doc)
                     
                     # Move to top
                     self._left_response_area.setCaretPosition(0)
                     self._right_response_area.setCaretPosition(0)
                 except Exception as e:
-                    self._debug_print("Error updating side-by-side UI: " + str(e))
+                    self._debug_print("Error updating side-by-side UI: %s", e)
             
+            # Cancelled by a newer selection - its render supersedes this one
+            if java.lang.Thread.currentThread().isInterrupted():
+                return
             SwingUtilities.invokeLater(update_ui)
             
         except Exception as e:
@@ -1446,17 +1838,16 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
     def _export_diff_report(self):
         """Export detailed diff report"""
         try:
-            filename = "domain_mirror_diff_" + time.strftime("%Y%m%d_%H%M%S") + ".txt"
+            filename = "domain_mirror_diff_" + self._format_time("yyyyMMdd_HHmmss") + ".txt"
             
-            with open(filename, "w") as f:
+            with open(filename, "w", EXPORT_BUFFER_SIZE) as f:
                 f.write("Domain Mirror Diff Report\n")
-                f.write("Generated: " + time.strftime("%Y-%m-%d %H:%M:%S") + "\n")
+                f.write("Generated: " + self._format_time("yyyy-MM-dd HH:mm:ss") + "\n")
                 f.write("=" * 80 + "\n\n")
                 
                 mismatch_count = 0
                 
-                for i in range(self.results.size()):
-                    result = self.results.get(i)
+                for result in self._results_snapshot():
                     if not result.get("match"):
                         mismatch_count += 1
                         f.write("\n" + "=" * 80 + "\n")
@@ -1473,34 +1864,40 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
                         f.write("-" * 60 + "\n")
                         for domain, data in responses.items():
                             f.write("{}: status={}, size={}, hash={}\n".format(
-                                domain, data.get("status"), data.get("size"), data.get("hash", "")[:16]
+                                domain, data.status, data.size, data.hash[:16]
                             ))
                         
                         # Diff for each pair
                         if len(domains) >= 2:
                             primary = domains[0]
-                            primary_body = responses[primary].get("body", "")
+                            primary_data = responses[primary]
+                            primary_lines = None  # Split once, shared by every pair
                             
                             for other in domains[1:]:
-                                other_body = responses[other].get("body", "")
+                                other_data = responses[other]
                                 
                                 f.write("\n\nDiff: {} vs {}\n".format(primary, other))
                                 f.write("-" * 60 + "\n")
                                 
-                                diff = difflib.unified_diff(
-                                    primary_body.splitlines(keepends=True),
-                                    other_body.splitlines(keepends=True),
-                                    fromfile=primary,
-                                    tofile=other
-                                )
-                                f.writelines(diff)
+                                if self._same_body(other_data, primary_data):
+                                    f.write("(identical)\n")
+                                    continue
+                                
+                                if primary_lines is None:
+                                    primary_lines = self._body_lines(primary_data)
+                                for line in self._unified_diff(
+                                        primary_lines,
+                                        self._body_lines(other_data),
+                                        primary, other):
+                                    f.write(line)
+                                    f.write("\n")
                         
                         # Full bodies
                         f.write("\n\nFull Response Bodies:\n")
                         f.write("-" * 60 + "\n")
                         for domain, data in responses.items():
                             f.write("\n--- {} ---\n".format(domain))
-                            f.write(data.get("body", "(empty)"))
+                            f.write((self._response_body(data) or "(empty)"))
                             f.write("\n")
                 
                 f.write("\n\n" + "=" * 80 + "\n")
@@ -1514,43 +1911,27 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
             self._log("Export error: " + str(e))
             JOptionPane.showMessageDialog(self._main_panel, "Export failed: " + str(e))
     
-    def _get_filtered_result_index(self, filtered_row, filter_val):
-        """Get actual result index from filtered row"""
-        filtered_idx = 0
-        for i in range(self.results.size()):
-            r = self.results.get(i)
-            include = (filter_val == "All" or 
-                      (filter_val == "Mismatches Only" and not r.get("match")) or
-                      (filter_val == "Matches Only" and r.get("match")))
-            if include:
-                if filtered_idx == filtered_row:
-                    return i
-                filtered_idx += 1
-        return -1
-    
     def _export_results(self):
         """Export results"""
         try:
-            filename = "domain_mirror_" + time.strftime("%Y%m%d_%H%M%S") + ".csv"
+            filename = "domain_mirror_" + self._format_time("yyyyMMdd_HHmmss") + ".csv"
             
-            with open(filename, "w") as f:
-                f.write("Index,Method,Path,Match,Timestamp,Domains,Hashes\n")
+            with open(filename, "wb", EXPORT_BUFFER_SIZE) as f:
+                # csv quotes any field that needs it (commas, quotes, newlines)
+                writer = csv.writer(f, lineterminator="\n")
+                writer.writerow(["Index", "Method", "Path", "Match", "Timestamp", "Domains", "Hashes"])
                 
-                for i in range(self.results.size()):
-                    r = self.results.get(i)
+                for i, r in enumerate(self._results_snapshot()):
                     responses = r.get("responses", {})
-                    domains_str = ";".join(responses.keys())
-                    hashes_str = ";".join([d.get("hash", "")[:8] for d in responses.values()])
-                    
-                    f.write("{},{},\"{}\",{},{},{},{}\n".format(
+                    writer.writerow([
                         i + 1,
                         r.get("method", ""),
-                        r.get("path", "").replace('"', '""'),
+                        r.get("path", ""),
                         "Yes" if r.get("match") else "No",
                         r.get("timestamp", ""),
-                        domains_str,
-                        hashes_str
-                    ))
+                        ";".join(responses.keys()),
+                        ";".join([d.hash[:8] for d in responses.values()])
+                    ])
             
             self._log("Exported to " + filename)
             JOptionPane.showMessageDialog(self._main_panel, "Exported to " + filename)
@@ -1678,7 +2059,7 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         self._max_threads_field = JTextField(str(self._max_concurrent_mirrors), 8)
         self._max_threads_field.setToolTipText("Maximum number of simultaneous mirror requests")
         max_threads_row.add(self._max_threads_field)
-        max_threads_row.add(JLabel("  (requests skipped when exceeded)"))
+        max_threads_row.add(JLabel("  (extra requests queue, skipped when queue is full)"))
         limits_panel.add(max_threads_row)
         
         # Request timeout row
@@ -1731,48 +2112,32 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         self.login_patterns = [p.strip() for p in self._login_patterns_field.getText().split(",") if p.strip()]
         self.refresh_patterns = [p.strip() for p in self._refresh_patterns_field.getText().split(",") if p.strip()]
         self.token_keys = [k.strip() for k in self._token_keys_field.getText().split(",") if k.strip()]
+        self._compile_patterns()
         self.auto_refresh_mirrors = self._auto_refresh_checkbox.isSelected()
         
         # Resource limits (with validation)
-        try:
-            max_results = int(self._max_results_field.getText().strip())
-            if max_results < 10:
-                max_results = 10
-            elif max_results > 100000:
-                max_results = 100000
+        max_results = self._parse_int_field(
+            self._max_results_field, self._max_results, 10, 100000, "max results")
+        if max_results != self._max_results:
             self._max_results = max_results
-        except:
-            self._log("Invalid max results value, keeping current: " + str(self._max_results))
+            self._results_write_lock.lock()
+            try:
+                if self.results.set_capacity(max_results):
+                    self._results_generation += 1
+            finally:
+                self._results_write_lock.unlock()
+            self._refresh_results_table()
         
-        try:
-            max_threads = int(self._max_threads_field.getText().strip())
-            if max_threads < 1:
-                max_threads = 1
-            elif max_threads > 50:
-                max_threads = 50
+        max_threads = self._parse_int_field(
+            self._max_threads_field, self._max_concurrent_mirrors, 1, 50, "max threads")
+        if max_threads != self._max_concurrent_mirrors:
             self._max_concurrent_mirrors = max_threads
-        except:
-            self._log("Invalid max threads value, keeping current: " + str(self._max_concurrent_mirrors))
+            self._resize_mirror_pool(max_threads)
         
-        try:
-            timeout = int(self._timeout_field.getText().strip())
-            if timeout < 1:
-                timeout = 1
-            elif timeout > 120:
-                timeout = 120
-            self._request_timeout = timeout
-        except:
-            self._log("Invalid timeout value, keeping current: " + str(self._request_timeout))
-        
-        try:
-            diff_lines = int(self._diff_limit_field.getText().strip())
-            if diff_lines < 50:
-                diff_lines = 50
-            elif diff_lines > 10000:
-                diff_lines = 10000
-            self._max_diff_lines = diff_lines
-        except:
-            self._log("Invalid diff lines value, keeping current: " + str(self._max_diff_lines))
+        self._request_timeout = self._parse_int_field(
+            self._timeout_field, self._request_timeout, 1, 120, "timeout")
+        self._max_diff_lines = self._parse_int_field(
+            self._diff_limit_field, self._max_diff_lines, 50, 10000, "diff lines")
         
         # Update UI fields to show validated values
         self._max_results_field.setText(str(self._max_results))
@@ -1792,6 +2157,17 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         self._log("  Limits: max_results={}, max_threads={}, timeout={}s, diff_lines={}".format(
             self._max_results, self._max_concurrent_mirrors, self._request_timeout, self._max_diff_lines))
     
+    def _parse_int_field(self, field, current, lo, hi, label):
+        """Parse an integer setting clamped to [lo, hi], keeping current if invalid"""
+        text = field.getText().strip()
+        if text == str(current):
+            return current
+        try:
+            return max(lo, min(hi, int(text)))
+        except ValueError:
+            self._log("Invalid {} value, keeping current: {}".format(label, current))
+            return current
+    
     def _reset_settings_to_defaults(self):
         """Reset all settings to default values"""
         # Tool interception
@@ -1854,82 +2230,199 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         self.debug_mode = self._debug_checkbox.isSelected()
         self._log("Debug logging " + ("ENABLED" if self.debug_mode else "DISABLED"))
     
-    def _debug_log(self, message):
-        """Log debug message (only if debug mode is enabled)"""
+    def _debug_log(self, message, *args):
+        """Log debug message (only if debug mode is enabled) - args are %-formatted lazily"""
         if not self.debug_mode:
             return
-        self._log("[DEBUG] " + message)
+        self._log("[DEBUG] " + (message % args if args else message))
     
-    def _debug_print(self, message):
-        """Print debug message to console (only if debug mode is enabled)"""
+    def _debug_print(self, message, *args):
+        """Print debug message to console (only if debug mode is enabled) - args are %-formatted lazily"""
         if not self.debug_mode:
             return
-        print("[DM DEBUG] " + message)
+        print("[DM DEBUG] " + (message % args if args else message))
+    
+    def _body_hash(self, body_bytes):
+        """64-bit fingerprint of raw body bytes (CRC32C and Adler32 halves) as 16 hex digits"""
+        # Only used to compare responses for equality, so a cryptographic
+        # digest isn't needed - both checksums are JDK intrinsics
+        crc = BodyCRC()
+        crc.update(body_bytes)
+        adler = Adler32()
+        adler.update(body_bytes)
+        return "%08x%08x" % (crc.getValue(), adler.getValue())
+    
+    def _same_body(self, a, b):
+        """Whether two stored responses have equal bodies - by hash when both
+        have one, else by text (records loaded from old session files may not)"""
+        if a.hash and b.hash:
+            return a.hash == b.hash
+        return self._response_body(a) == self._response_body(b)
+    
+    def _response_body(self, data):
+        """Decoded body of a stored ResponseRecord - raw bytes are decoded on first use"""
+        # Views, diff workers and exports can race on the first decode, which
+        # sets body before clearing raw - so read raw first, and a None raw
+        # means body is already set (or the record never had a body)
+        raw = data.raw
+        body = data.body
+        if body is not None:
+            return body
+        if raw is None:
+            return data.body or ""
+        body = self._decoded_bodies.get(raw)
+        if body is None:
+            body = self._helpers.bytesToString(raw)
+            self._decoded_bodies.put(raw, body)
+        data.body = body
+        data.raw = None
+        return body
+    
+    def _body_lines(self, data, text=None):
+        """Lines of a stored response's body (no terminators) - treat as read-only.
+        The full body's split is cached on the record; pass text to split a
+        truncated copy of the body instead (not cached)."""
+        body = self._response_body(data)
+        if text is not None and len(text) != len(body):
+            return text.splitlines()
+        if data.lines is None:
+            data.lines = body.splitlines()
+        return data.lines
+    
+    def _serializable_responses(self, responses):
+        """Convert responses to session-file dicts with decoded bodies"""
+        out = {}
+        for domain, data in responses.items():
+            out[domain] = data.to_json(self._response_body(data))
+        return out
+    
+    def _results_snapshot(self):
+        """Copy out the current results (oldest first) under the read lock, so
+        long iterations such as saving and exporting run without holding it"""
+        self._results_read_lock.lock()
+        try:
+            return self.results.snapshot()
+        finally:
+            self._results_read_lock.unlock()
     
     def _add_result(self, result):
-        """Add a result with automatic cleanup if over limit"""
-        with self.results_lock:
-            # Remove oldest results if we're at the limit
-            while self.results.size() >= self._max_results:
-                self.results.remove(0)  # Remove oldest
+        """Add a result - at the limit the ring buffer overwrites the oldest in place"""
+        self._results_write_lock.lock()
+        try:
+            # Evictions are counted by the store and published by sync() as
+            # row deletions, so there's no generation bump here
             self.results.add(result)
+        finally:
+            self._results_write_lock.unlock()
     
-    def _refresh_domain_table(self):
-        """Refresh domain table while preserving selection"""
-        def do_refresh():
-            # Save selection
-            selected_row = self._domain_table.getSelectedRow()
-            
-            # Refresh
-            self._domain_model.fireTableDataChanged()
-            
-            # Restore selection if valid
-            if selected_row >= 0 and selected_row < self._domain_model.getRowCount():
-                self._domain_table.setRowSelectionInterval(selected_row, selected_row)
-        
-        SwingUtilities.invokeLater(do_refresh)
+    def _refresh_domain_table(self, entry):
+        """Schedule a coalesced repaint of entry's domain table row"""
+        self._dirty_domains.add(entry["domain"])
+        if not self._refresh_timer.isRunning():
+            self._refresh_timer.start()
     
     def _refresh_results_table(self):
-        """Refresh results table while preserving selection"""
-        def do_refresh():
-            # Save selection
-            selected_row = self._results_table.getSelectedRow()
-            
-            # Refresh
-            self._results_model.fireTableDataChanged()
-            if hasattr(self, '_update_results_count'):
-                self._update_results_count()
-            
-            # Restore selection if valid
-            if selected_row >= 0 and selected_row < self._results_model.getRowCount():
-                self._results_table.setRowSelectionInterval(selected_row, selected_row)
-        
-        SwingUtilities.invokeLater(do_refresh)
-    
-    def _can_start_mirror_thread(self):
-        """Check if we can start another mirror thread"""
-        with self._mirror_thread_lock:
-            if self._active_mirror_threads >= self._max_concurrent_mirrors:
-                return False
-            self._active_mirror_threads += 1
+        """Schedule a coalesced results table refresh"""
+        if self._results_refresh_pending.compareAndSet(False, True) and not self._refresh_timer.isRunning():
+            self._refresh_timer.start()
+    
+    def _on_table_shown(self, event):
+        """Flush refreshes deferred while a table was hidden once it is shown again"""
+        if (event.getChangeFlags() & HierarchyEvent.SHOWING_CHANGED) and event.getComponent().isShowing():
+            if (self._results_refresh_pending.get() or not self._dirty_domains.isEmpty()) and not self._refresh_timer.isRunning():
+                self._refresh_timer.start()
+    
+    def _flush_pending_refreshes(self):
+        """Fire the pending table model events for visible tables - runs on the EDT via the refresh timer"""
+        if self._results_table.isShowing() and self._results_refresh_pending.getAndSet(False):
+            self._results_model.sync()
+            self._update_results_count()
+        
+        if not self._dirty_domains.isEmpty() and self._domain_table.isShowing():
+            # Take the current batch - captures landing meanwhile start a new one
+            dirty = ArrayList(self._dirty_domains)
+            self._dirty_domains.removeAll(dirty)
+            
+            # Row updates keep the selection, so only the changed rows repaint
+            # and the detail view is rebuilt only if its domain changed
+            selected_row = self._domain_table.getSelectedRow()
+            selected_changed = False
+            for row, entry in enumerate(self.domains):
+                if dirty.contains(entry["domain"]):
+                    self._domain_model.fireTableRowsUpdated(row, row)
+                    selected_changed = selected_changed or row == selected_row
+            if selected_changed:
+                self._update_session_detail()
+    
+    def _submit_background(self, task):
+        """Queue task on the mirror pool - returns False if the pool is saturated"""
+        try:
+            self._mirror_pool.execute(task)
             return True
+        except RejectedExecutionException:
+            return False
     
-    def _mirror_thread_finished(self):
-        """Mark a mirror thread as finished"""
-        with self._mirror_thread_lock:
-            self._active_mirror_threads = max(0, self._active_mirror_threads - 1)
+    def _resize_mirror_pool(self, size):
+        """Apply a new max-concurrent-mirrors value to the pool"""
+        # Core size may never exceed max size, so order the updates by direction
+        if size > self._mirror_pool.getMaximumPoolSize():
+            self._mirror_pool.setMaximumPoolSize(size)
+            self._mirror_pool.setCorePoolSize(size)
+        else:
+            self._mirror_pool.setCorePoolSize(size)
+            self._mirror_pool.setMaximumPoolSize(size)
+    
+    def _format_time(self, pattern, epoch=None):
+        """Format epoch seconds (default: now) with a cached SimpleDateFormat pattern"""
+        formats = getattr(self._date_formats, "cache", None)
+        if formats is None:
+            formats = self._date_formats.cache = {}
+        fmt = formats.get(pattern)
+        if fmt is None:
+            fmt = formats[pattern] = SimpleDateFormat(pattern)
+        if epoch is None:
+            return fmt.format(Date())
+        return fmt.format(Date(int(epoch * 1000)))
     
-    def _log(self, message):
-        """Log message"""
-        ts = time.strftime("%H:%M:%S")
+    def _log(self, message, *args):
+        """Log message - args are %-formatted into message"""
+        if args:
+            message = message % args
+        ts = self._format_time("HH:mm:ss")
         log_msg = "[" + ts + "] " + message + "\n"
         print("[Domain Mirror] " + message)
         
-        def update():
-            self._log_area.append(log_msg)
-            self._log_area.setCaretPosition(self._log_area.getDocument().getLength())
-        
-        SwingUtilities.invokeLater(update)
+        self._log_queue.add(log_msg)
+        if not self._log_timer.isRunning():
+            self._log_timer.start()
+    
+    def _flush_log(self):
+        """Append all queued log lines in one batch and trim the oldest - runs on the EDT"""
+        lines = ArrayList()
+        self._log_queue.drainTo(lines)
+        if lines.isEmpty():
+            return
+        self._log_area.append("".join(lines))
+        
+        doc = self._log_area.getDocument()
+        overflow = doc.getLength() - self._max_log_chars
+        if overflow > 0:
+            # Cut at a line boundary so the first kept line is whole
+            cut = self._log_area.getLineEndOffset(self._log_area.getLineOfOffset(overflow))
+            doc.remove(0, cut)
+        self._log_area.setCaretPosition(doc.getLength())
+    
+    # === IExtensionStateListener ===
+    
+    def extensionUnloaded(self):
+        """Stop background workers when the extension is unloaded"""
+        self._refresh_timer.stop()
+        self._log_timer.stop()
+        self._mirror_pool.shutdownNow()
+        self._refresh_pool.shutdownNow()
+        self._http_exec.shutdownNow()
+        self._diff_exec.shutdownNow()
+        self._sbs_exec.shutdownNow()
     
     # === ITab ===
     
@@ -1943,18 +2436,6 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
     
     def processProxyMessage(self, messageIsRequest, message):
         """Process proxy messages"""
-        # Basic logging to confirm listener is active (only in debug mode)
-        if self.debug_mode and not messageIsRequest:
-            try:
-                info = message.getMessageInfo()
-                service = info.getHttpService()
-                if service:
-                    host = service.getHost()
-                    domain_count = self.domains.size()
-                    self._debug_log("PROXY: " + host + " (domains: " + str(domain_count) + ")")
-            except:
-                pass
-        
         try:
             info = message.getMessageInfo()
             service = info.getHttpService()
@@ -1962,102 +2443,47 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
                 return
             
             host = service.getHost()
+            debug = self.debug_mode
             
-            # Debug: Log when we see traffic from tracked domains
-            entry = self._get_domain_entry(host)
+            # Basic logging to confirm listener is active (only in debug mode)
+            if debug and not messageIsRequest:
+                self._debug_log("PROXY: %s (domains: %s)", host, self.domains.size())
             
+            entry = self._get_domain_entry(host)
             if not entry:
                 return
             
-            # WE FOUND A MATCH!
-            self._debug_log("MATCHED: " + host + " -> " + entry["domain"])
+            if debug:
+                self._debug_log("MATCHED: %s -> %s", host, entry["domain"])
             
             if messageIsRequest:
                 self._capture_from_request(host, info.getRequest(), entry)
             else:
                 # This is a RESPONSE from a tracked domain
-                self._debug_print("Processing RESPONSE for: " + host)
-                self._debug_print("mirror_enabled = " + str(self.mirror_enabled))
-                self._debug_print("mirror_from_proxy = " + str(self.mirror_from_proxy))
-                self._debug_print("is_primary = " + str(entry["is_primary"]))
-                
                 is_primary = entry["is_primary"]
+                if debug:
+                    self._debug_print("Processing RESPONSE for: %s (mirror_enabled=%s, mirror_from_proxy=%s, is_primary=%s)",
+                                      host, self.mirror_enabled, self.mirror_from_proxy, is_primary)
                 
                 # FIRST: Check if we should mirror (before any other processing)
                 # Now also checks the mirror_from_proxy flag
                 if self.mirror_enabled and is_primary and self.mirror_from_proxy:
-                    self._debug_print("WILL MIRROR!")
                     mirrors = self._get_mirror_domains()
-                    self._debug_print("Found " + str(len(mirrors)) + " mirror domains")
                     
                     if mirrors:
                         # Get request/response bytes NOW while we're in the callback
-                        self._debug_print("Getting request bytes...")
-                        request_bytes = info.getRequest()
-                        self._debug_print("Got request bytes: " + str(len(request_bytes) if request_bytes else 0))
-                        
-                        self._debug_print("Getting response bytes...")
-                        response_bytes = info.getResponse()
-                        self._debug_print("Got response bytes: " + str(len(response_bytes) if response_bytes else 0))
-                        
-                        # Get path by parsing first line manually (avoid analyzeRequest blocking)
-                        self._debug_print("Parsing request manually...")
-                        try:
-                            request_str = self._helpers.bytesToString(request_bytes)
-                            first_line = request_str.split("\r\n")[0] if "\r\n" in request_str else request_str.split("\n")[0]
-                            # First line is like "GET /path HTTP/1.1"
-                            parts = first_line.split(" ")
-                            path = parts[1] if len(parts) >= 2 else "/"
-                            self._debug_print("Path: " + path)
-                        except Exception as e:
-                            self._debug_print("Parse failed: " + str(e))
-                            path = "/unknown"
-                        
-                        # Get service info
-                        protocol = service.getProtocol()
-                        port = service.getPort()
-                        self._debug_print("Service: " + protocol + "://" + host + ":" + str(port))
-                        
-                        self._log(">>> MIRRORING: " + path + " to " + str(len(mirrors)) + " mirror(s)")
-                        
-                        # Check if we can start another thread
-                        if not self._can_start_mirror_thread():
-                            self._log("WARNING: Too many concurrent mirrors, skipping")
+                        if not self._dispatch_mirror(service, info.getRequest(), info.getResponse(), mirrors):
                             return
-                        
-                        self._debug_print("Starting mirror thread...")
-                        
-                        # Capture ALL needed data for the thread
-                        def do_mirror(req_bytes=request_bytes, resp_bytes=response_bytes, 
-                                     src_host=host, src_protocol=protocol, src_port=port,
-                                     mirror_list=mirrors):
-                            try:
-                                self._debug_print("Mirror thread started!")
-                                self._mirror_request_v2(req_bytes, resp_bytes, src_host, 
-                                                       src_protocol, src_port, mirror_list)
-                                self._debug_print("Mirror thread completed!")
-                            except Exception as e:
-                                self._debug_print("Mirror thread EXCEPTION: " + str(e))
-                                self._log("Mirror thread error: " + str(e))
-                                import traceback
-                                traceback.print_exc()
-                            finally:
-                                self._mirror_thread_finished()
-                        
-                        t = Thread(target=do_mirror)
-                        t.daemon = True  # Allow JVM to exit even if thread is running
-                        t.start()
-                        self._debug_print("Thread started OK")
                     else:
                         self._log("WARNING: No mirror domains configured!")
                 else:
-                    self._debug_print("NOT mirroring - mirror_enabled=" + str(self.mirror_enabled) + " is_primary=" + str(is_primary) + " mirror_from_proxy=" + str(self.mirror_from_proxy))
+                    self._debug_print("NOT mirroring - mirror_enabled=%s is_primary=%s mirror_from_proxy=%s", self.mirror_enabled, is_primary, self.mirror_from_proxy)
                 
                 # THEN: Do session capture (after mirroring is triggered)
                 try:
                     self._capture_from_response(host, info.getRequest(), info.getResponse(), entry)
                 except Exception as e:
-                    self._debug_print("_capture_from_response EXCEPTION: " + str(e))
+                    self._debug_print("_capture_from_response EXCEPTION: %s", e)
                     
         except Exception as e:
             self._log("processProxyMessage error: " + str(e))
@@ -2070,16 +2496,10 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         if not service:
             return
         
-        # Skip our own mirror requests to prevent infinite loops
-        if messageIsRequest:
-            try:
-                request_bytes = messageInfo.getRequest()
-                if request_bytes:
-                    request_str = self._helpers.bytesToString(request_bytes)
-                    if "X-DomainMirror-Internal: true" in request_str:
-                        return  # This is our own request, skip it
-            except:
-                pass
+        # Skip our own mirror requests to prevent infinite loops. They are sent
+        # with makeHttpRequest, so they only ever arrive as Extender traffic.
+        if toolFlag == TOOL_EXTENDER and self._is_own_request(messageInfo.getRequest()):
+            return
         
         host = service.getHost()
         entry = self._get_domain_entry(host)
@@ -2101,52 +2521,117 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
                 if mirrors:
                     request_bytes = messageInfo.getRequest()
                     response_bytes = messageInfo.getResponse()
-                    
                     if request_bytes and response_bytes:
-                        # Double-check this isn't our own request
-                        try:
-                            request_str = self._helpers.bytesToString(request_bytes)
-                            if "X-DomainMirror-Internal: true" in request_str:
-                                return  # Skip our own requests
-                        except:
-                            pass
-                        
-                        # Get tool name for logging
-                        tool_name = self._get_tool_name(toolFlag)
-                        
-                        # Parse path
-                        try:
-                            request_str = self._helpers.bytesToString(request_bytes)
-                            first_line = request_str.split("\r\n")[0] if "\r\n" in request_str else request_str.split("\n")[0]
-                            parts = first_line.split(" ")
-                            path = parts[1] if len(parts) >= 2 else "/"
-                        except:
-                            path = "/unknown"
-                        
-                        protocol = service.getProtocol()
-                        port = service.getPort()
-                        
-                        self._log("[" + tool_name + "] >>> MIRRORING: " + path + " to " + str(len(mirrors)) + " mirror(s)")
-                        
-                        # Check if we can start another thread
-                        if not self._can_start_mirror_thread():
-                            self._log("WARNING: Too many concurrent mirrors, skipping")
-                            return
-                        
-                        def do_mirror(req_bytes=request_bytes, resp_bytes=response_bytes,
-                                     src_host=host, src_protocol=protocol, src_port=port,
-                                     mirror_list=mirrors, tool=tool_name):
-                            try:
-                                self._mirror_request_v2(req_bytes, resp_bytes, src_host,
-                                                       src_protocol, src_port, mirror_list)
-                            except Exception as e:
-                                self._log("[" + tool + "] Mirror error: " + str(e))
-                            finally:
-                                self._mirror_thread_finished()
-                        
-                        t = Thread(target=do_mirror)
-                        t.daemon = True
-                        t.start()
+                        self._dispatch_mirror(service, request_bytes, response_bytes, mirrors,
+                                              self._get_tool_name(toolFlag))
+    
+    def _dispatch_mirror(self, service, request_bytes, response_bytes, mirrors, tool_name=None):
+        """Queue a mirror job for a primary message - returns False if the pool is saturated"""
+        # Only the service fields are read here - the request itself is parsed
+        # by the worker, so Burp's listener thread is released immediately
+        host = service.getHost()
+        protocol = service.getProtocol()
+        port = service.getPort()
+        log_prefix = "[" + tool_name + "] " if tool_name else ""
+        if self.debug_mode:
+            self._debug_print("Queueing mirror job: %s%s://%s:%s to %s mirrors (request %s bytes, response %s bytes)",
+                              log_prefix, protocol, host, port, len(mirrors),
+                              len(request_bytes) if request_bytes else 0,
+                              len(response_bytes) if response_bytes else 0)
+        
+        def do_mirror():
+            try:
+                self._mirror_request_v2(request_bytes, response_bytes, host,
+                                        protocol, port, mirrors, log_prefix=log_prefix)
+            except Exception as e:
+                self._log(log_prefix + "Mirror thread error: " + str(e))
+                import traceback
+                traceback.print_exc()
+        
+        # A burst that overflows the queue would log one warning per dropped
+        # job - log the first drop, then the total once jobs are accepted again
+        if not self._submit_background(do_mirror):
+            if self._mirror_skipped.getAndIncrement() == 0:
+                self._log("WARNING: Too many concurrent mirrors, skipping")
+            return False
+        if self._mirror_skipped.get():
+            skipped = self._mirror_skipped.getAndSet(0)
+            if skipped:
+                self._log("Mirror queue has room again - skipped %s request(s) while it was full", skipped)
+        return True
+    
+    def _request_key(self, request_bytes):
+        """64-bit identity key for request bytes (truncated SHA-1)"""
+        md = MessageDigest.getInstance("SHA-1")
+        md.update(request_bytes)
+        return ByteBuffer.wrap(md.digest()).getLong()
+    
+    def _request_line(self, request_bytes):
+        """Decode just the request line - the rest of the request is never converted"""
+        # Request lines beyond 8KB are rejected by most servers anyway
+        limit = min(len(request_bytes), 8192)
+        end = self._helpers.indexOf(request_bytes, self._newline_bytes, True, 0, limit)
+        if end < 0:
+            end = limit
+        return self._helpers.bytesToString(request_bytes[:end]).rstrip("\r")
+    
+    def _request_target(self, request_bytes):
+        """(method, request target) sliced from the request line between its first two spaces"""
+        line = self._request_line(request_bytes)
+        sp1 = line.find(" ")
+        if sp1 < 0:
+            return line, ""
+        sp2 = line.find(" ", sp1 + 1)
+        return line[:sp1], (line[sp1 + 1:sp2] if sp2 >= 0 else line[sp1 + 1:])
+    
+    def _request_path(self, request_bytes):
+        """Path of the request target (query string dropped), read from the request line only"""
+        target = self._request_target(request_bytes)[1]
+        query = target.find("?")
+        return target[:query] if query >= 0 else target
+    
+    def _is_own_request(self, request_bytes):
+        """Check if request bytes belong to one of our mirror requests"""
+        if not request_bytes:
+            return False
+        if self._our_mirror_requests.containsKey(self._request_key(request_bytes)):
+            return True
+        # Fallback for requests Burp rewrote in flight - look for the marker
+        # header, searching only the header block and never the body
+        try:
+            return self._helpers.indexOf(request_bytes, self._mirror_marker_bytes, True, 0,
+                                         self._header_end(request_bytes)) >= 0
+        except:
+            return False
+    
+    def _header_end(self, request_bytes):
+        """Offset of the blank line ending the headers (whole length if there is none)"""
+        length = len(request_bytes)
+        end = self._helpers.indexOf(request_bytes, self._header_end_bytes, False, 0, length)
+        if end < 0:
+            end = self._helpers.indexOf(request_bytes, self._lf_header_end_bytes, False, 0, length)
+        return end if end >= 0 else length
+    
+    def _header_lines(self, request_bytes):
+        """Request line and header lines, decoding only the header block"""
+        header_block = self._helpers.bytesToString(request_bytes[:self._header_end(request_bytes)])
+        return [line.rstrip("\r") for line in header_block.split("\n")]
+    
+    def _response_head(self, response_bytes):
+        """(status code, body offset) read from the status line and header end
+        without a full analyzeResponse parse, which is only the fallback"""
+        # Response header blocks beyond 16KB are rare enough to leave to Burp
+        limit = min(len(response_bytes), 16384)
+        end = self._helpers.indexOf(response_bytes, self._header_end_bytes, False, 0, limit)
+        if end >= 0:
+            # "HTTP/1.1 200 OK" - the code is the 3 digits after the first space
+            line = self._helpers.bytesToString(response_bytes[:min(end, 64)])
+            sp = line.find(" ")
+            code = line[sp + 1:sp + 4] if sp >= 0 else ""
+            if len(code) == 3 and code.isdigit():
+                return int(code), end + 4
+        info = self._helpers.analyzeResponse(response_bytes)
+        return info.getStatusCode(), info.getBodyOffset()
     
     def _should_mirror_from_tool(self, toolFlag):
         """Check if we should mirror requests from this tool"""
@@ -2177,52 +2662,44 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         return tool_names.get(toolFlag, "Tool-" + str(toolFlag))
     
     def _get_domain_entry(self, host):
-        """Get domain entry"""
-        # Use print for immediate output (bypasses async logging)
-        self._debug_print("_get_domain_entry called with host: " + str(host))
-        
-        with self.domains_lock:
-            size = self.domains.size()
-            self._debug_print("domains.size() = " + str(size))
-            
-            if size == 0:
-                self._debug_print("domains list is EMPTY!")
-                return None
-            
-            for i in range(size):
-                e = self.domains.get(i)
-                domain = e["domain"]
-                self._debug_print("Comparing '" + str(host) + "' with '" + str(domain) + "'")
-                
-                # Check exact match
-                if domain == host:
-                    self._debug_print("EXACT MATCH!")
-                    return e
-                # Check subdomain match
-                if host.endswith("." + domain):
-                    self._debug_print("SUBDOMAIN MATCH!")
-                    return e
-            
-            self._debug_print("No match found")
+        """Get domain entry (exact match first, then closest parent domain)"""
+        if not host:
+            return None
         
+        # Lock-free: _domain_map is a ConcurrentHashMap
+        domain_map = self._domain_map
+        entry = domain_map.get(host)
+        if entry is not None:
+            return entry
+        
+        # Check subdomain match by walking up the labels of host
+        dot = host.find(".")
+        while dot >= 0:
+            entry = domain_map.get(host[dot + 1:])
+            if entry is not None:
+                return entry
+            dot = host.find(".", dot + 1)
         return None
     
+    def _rebuild_topology(self):
+        """Rebuild the primary/mirrors snapshot - call with domains_lock held"""
+        primary = None
+        mirrors = []
+        for entry in self.domains:
+            if entry["is_primary"] and primary is None:
+                primary = entry
+            elif not entry["is_primary"]:
+                mirrors.append(entry)
+        # Single attribute store publishes the new snapshot to listener threads
+        self._topology = (primary, tuple(mirrors))
+    
     def _get_primary_domain(self):
         """Get primary domain"""
-        with self.domains_lock:
-            for i in range(self.domains.size()):
-                if self.domains.get(i)["is_primary"]:
-                    return self.domains.get(i)
-        return None
+        return self._topology[0]
     
     def _get_mirror_domains(self):
         """Get mirror domains"""
-        mirrors = []
-        with self.domains_lock:
-            for i in range(self.domains.size()):
-                if not self.domains.get(i)["is_primary"]:
-                    mirrors.append(self.domains.get(i))
-        return mirrors
+        return self._topology[1]
     
     def _capture_from_request(self, host, request, entry):
         """Capture session from request based on auth mode"""
@@ -2236,18 +2713,24 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         if auth_mode == AUTH_NONE:
             return
         
-        request_info = self._helpers.analyzeRequest(request)
-        headers = request_info.getHeaders()
+        # Only the header block is needed - analyzeRequest would also parse
+        # the body's parameters
+        headers = self._header_lines(request)
         updated = False
         
-        for header in headers:
-            header_lower = header.lower()
+        # Skip the request line; only the short header name is lowercased,
+        # and only for lines that could be Authorization or Cookie
+        for header in headers[1:]:
+            if header[:1] not in ("A", "a", "C", "c"):
+                continue
+            colon = header.find(":")
+            name = header[:colon].lower() if colon >= 0 else None
             
             # Capture bearer if applicable
-            if header_lower.startswith("authorization:"):
-                if auth_mode in [AUTH_AUTO, AUTH_BEARER, AUTH_BOTH]:
-                    auth_val = header.split(":", 1)[1].strip()
-                    if auth_val.lower().startswith("bearer "):
+            if name == "authorization":
+                if auth_mode in BEARER_AUTH_MODES:
+                    auth_val = header[colon + 1:].strip()
+                    if auth_val[:7].lower() == "bearer ":
                         token = auth_val[7:]
                         if token != session["bearer"]:
                             session["bearer"] = token
@@ -2257,23 +2740,25 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
                             self._log("Captured bearer: " + host)
             
             # Capture cookies if applicable
-            elif header_lower.startswith("cookie:"):
-                if auth_mode in [AUTH_AUTO, AUTH_COOKIES, AUTH_BOTH]:
-                    cookie_str = header.split(":", 1)[1].strip()
-                    for cookie in cookie_str.split(";"):
-                        cookie = cookie.strip()
-                        if "=" in cookie:
-                            name, value = cookie.split("=", 1)
-                            if session["cookies"].get(name.strip()) != value.strip():
-                                session["cookies"][name.strip()] = value.strip()
+            elif name == "cookie":
+                if auth_mode in COOKIE_AUTH_MODES:
+                    cookies = session["cookies"]
+                    for cookie in header[colon + 1:].split(";"):
+                        cookie_name, eq, value = cookie.partition("=")
+                        if eq:
+                            cookie_name = cookie_name.strip()
+                            value = value.strip()
+                            if cookies.get(cookie_name) != value:
+                                cookies[cookie_name] = value
                                 updated = True
                     
                     if updated:
+                        self._cookies_changed(session)
                         session["last_updated"] = time.time()
         
         if updated:
             self._update_session_status(session, auth_mode)
-            self._refresh_domain_table()
+            self._refresh_domain_table(entry)
     
     def _capture_from_response(self, host, request, response, entry):
         """Capture session from response"""
@@ -2286,20 +2771,13 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         if auth_mode == AUTH_NONE:
             return
         
-        request_info = self._helpers.analyzeRequest(request) if request else None
         response_info = self._helpers.analyzeResponse(response)
         headers = response_info.getHeaders()
-        
-        request_path = ""
-        if request_info:
-            url = request_info.getUrl()
-            request_path = url.getPath() if url else ""
-        
-        is_refresh = any(p in request_path.lower() for p in self.refresh_patterns)
+        request_path = self._request_path(request) if request else ""
         updated = False
         
         # Capture Set-Cookie
-        if auth_mode in [AUTH_AUTO, AUTH_COOKIES, AUTH_BOTH]:
+        if auth_mode in COOKIE_AUTH_MODES:
             for header in headers:
                 if header.lower().startswith("set-cookie:"):
                     cookie_str = header.split(":", 1)[1].strip()
@@ -2307,32 +2785,66 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
                     if "=" in cookie_part:
                         name, value = cookie_part.split("=", 1)
                         session["cookies"][name.strip()] = value.strip()
+                        self._cookies_changed(session)
                         session["last_updated"] = time.time()
                         updated = True
         
-        # Parse body for tokens
-        if auth_mode in [AUTH_AUTO, AUTH_BEARER, AUTH_BOTH]:
+        # Parse body for tokens - only JSON objects that contain a candidate
+        # key are decoded at all
+        if auth_mode in BEARER_AUTH_MODES:
             body_offset = response_info.getBodyOffset()
-            body = self._helpers.bytesToString(response[body_offset:])
-            
-            if body.strip().startswith("{"):
+            if self._may_hold_tokens(response, body_offset):
+                body = self._helpers.bytesToString(response[body_offset:])
                 if self._extract_tokens_from_json(session, body, host):
                     updated = True
         
         if updated:
+            # The login match only feeds this debug line, so skip it otherwise
+            if self.debug_mode and self._is_login_path(request_path):
+                self._debug_print("Session captured from login response: %s%s", host, request_path)
             self._update_session_status(session, auth_mode)
-            self._refresh_domain_table()
-            SwingUtilities.invokeLater(lambda: self._update_session_detail())
+            self._refresh_domain_table(entry)
         
-        # Trigger mirror refresh
-        if is_refresh and entry["is_primary"] and self.auto_refresh_mirrors:
+        # Trigger mirror refresh - the cheap flag checks go first so the
+        # pattern match only runs for the primary
+        if entry["is_primary"] and self.auto_refresh_mirrors and self._is_refresh_path(request_path):
             self._log("Primary refreshed - updating mirrors...")
             for mirror in self._get_mirror_domains():
-                def start_refresh(m=mirror["domain"]):
-                    t = Thread(target=lambda: self._trigger_refresh(m))
-                    t.daemon = True
-                    t.start()
-                start_refresh()
+                # A mirror already refreshing would drop this job anyway
+                if not self.pending_refresh.contains(mirror["domain"]):
+                    self._refresh_pool.execute(lambda m=mirror["domain"]: self._trigger_refresh(m))
+    
+    def _cookies_changed(self, session):
+        """Invalidate the cached Cookie header after session["cookies"] changed"""
+        session["cookie_version"] = session.get("cookie_version", 0) + 1
+    
+    def _cookie_header(self, session):
+        """Full Cookie header line for session's cookies, rebuilt only after they change"""
+        version = session.get("cookie_version", 0)
+        cached = session.get("cookie_header")
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        # Tagged with the version read before building, so a change landing
+        # mid-build leaves the cache stale-tagged and it is rebuilt next time
+        sb = java.lang.StringBuilder(256).append("Cookie: ")
+        sep = ""
+        for name, value in session["cookies"].iteritems():
+            sb.append(sep).append(name).append("=").append(value)
+            sep = "; "
+        header = sb.toString()
+        session["cookie_header"] = (version, header)
+        return header
+    
+    def _bearer_header(self, session):
+        """Full Authorization header line for session's bearer token, rebuilt only when it changes"""
+        bearer = session["bearer"]
+        cached = session.get("bearer_header")
+        # Every capture stores a new token string, so identity is the version
+        if cached is not None and cached[0] is bearer:
+            return cached[1]
+        header = "Authorization: Bearer " + bearer
+        session["bearer_header"] = (bearer, header)
+        return header
     
     def _update_session_status(self, session, auth_mode):
         """Update session status based on what's captured"""
@@ -2360,13 +2872,87 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         elif auth_mode == AUTH_NONE:
             session["status"] = "ready"  # None is always ready
     
+    def _compile_path_matcher(self, patterns):
+        """Compile path substrings into one case-insensitive, prefix-factored regex"""
+        # Patterns share prefixes ("/auth", "/auth/refresh", "/api/..."), so
+        # they are merged into a trie first. The regex then tests each path
+        # character once per trie branch instead of once per pattern, and a
+        # pattern that contains another is dropped since find() stops at
+        # the shorter one anyway
+        trie = {}
+        for pattern in patterns:
+            if not pattern:
+                continue
+            node = trie
+            for ch in pattern.lower():
+                node = node.setdefault(ch, {})
+            node[""] = None
+        if not trie:
+            return None
+        
+        def build(node):
+            if "" in node:
+                return ""
+            branches = [Pattern.quote(ch) + build(child) for ch, child in sorted(node.items())]
+            return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        
+        return Pattern.compile(build(trie), Pattern.CASE_INSENSITIVE | Pattern.UNICODE_CASE)
+    
+    def _compile_patterns(self):
+        """Precompile login/refresh path matchers and token key sets"""
+        self._login_re = self._compile_path_matcher(self.login_patterns)
+        self._refresh_re = self._compile_path_matcher(self.refresh_patterns)
+        self._token_keys_set = frozenset(self.token_keys)
+        self._refresh_keys_set = frozenset(self.refresh_token_keys)
+        # Matches any candidate key as a quoted JSON member name, so bodies
+        # without one are rejected before json.loads builds the whole tree
+        needles = self._token_keys_set | self._refresh_keys_set
+        self._token_needle_re = Pattern.compile(
+            "\"(?:" + "|".join(Pattern.quote(k) for k in sorted(needles)) + ")\"\\s*:")
+        # The same keys as quoted byte strings, to prescan raw bodies before decoding
+        self._token_key_bytes = [self._helpers.stringToBytes("\"" + k + "\"") for k in sorted(needles)]
+    
+    def _is_login_path(self, path):
+        """Check if path hits a login endpoint"""
+        login_re = self._login_re
+        return bool(path) and login_re is not None and login_re.matcher(path).find()
+    
+    def _is_refresh_path(self, path):
+        """Check if path hits a token refresh endpoint"""
+        refresh_re = self._refresh_re
+        return bool(path) and refresh_re is not None and refresh_re.matcher(path).find()
+    
+    def _may_hold_tokens(self, response, body_offset):
+        """Prescan raw body bytes: a JSON object mentioning a token key as a quoted string"""
+        end = len(response)
+        start = body_offset
+        while start < end and response[start] in (32, 9, 10, 13):
+            start += 1
+        if start >= end or response[start] != 123:  # "{"
+            return False
+        index_of = self._helpers.indexOf
+        for key_bytes in self._token_key_bytes:
+            if index_of(response, key_bytes, True, start, end) >= 0:
+                return True
+        return False
+    
     def _extract_tokens_from_json(self, session, body, host):
         """Extract tokens from JSON"""
+        if not self._token_needle_re.matcher(body).find():
+            return False
         try:
             data = json.loads(body)
             updated = False
             
-            def find_value(d, keys):
+            if not isinstance(data, dict):
+                return False
+            
+            def find_value(d, keys, key_set):
+                # Cheap set test first; the ordered scan only runs on a hit
+                if key_set.isdisjoint(d) and not any(
+                        isinstance(d.get(k), dict) and not key_set.isdisjoint(d[k])
+                        for k in ("data", "result")):
+                    return None
                 for key in keys:
                     if key in d:
                         return d[key]
@@ -2376,7 +2962,7 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
                         return d["result"][key]
                 return None
             
-            token = find_value(data, self.token_keys)
+            token = find_value(data, self.token_keys, self._token_keys_set)
             if token and token != session["bearer"]:
                 session["bearer"] = token
                 session["last_updated"] = time.time()
@@ -2384,7 +2970,7 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
                 updated = True
                 self._log("Captured token from response: " + host)
             
-            refresh = find_value(data, self.refresh_token_keys)
+            refresh = find_value(data, self.refresh_token_keys, self._refresh_keys_set)
             if refresh and refresh != session["refresh_token"]:
                 session["refresh_token"] = refresh
                 session["last_updated"] = time.time()
@@ -2416,10 +3002,8 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
     
     def _trigger_refresh(self, domain):
         """Trigger token refresh"""
-        with self.pending_refresh_lock:
-            if domain in self.pending_refresh:
-                return
-            self.pending_refresh.add(domain)
+        if not self.pending_refresh.add(domain):
+            return
         
         try:
             entry = self._get_domain_entry(domain)
@@ -2441,12 +3025,11 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
                 "Content-Type: application/json"
             ]
             
-            if cookies and entry["auth_mode"] in [AUTH_AUTO, AUTH_COOKIES, AUTH_BOTH]:
-                cookie_str = "; ".join([k + "=" + v for k, v in cookies.items()])
-                headers.append("Cookie: " + cookie_str)
+            if cookies and entry["auth_mode"] in COOKIE_AUTH_MODES:
+                headers.append(self._cookie_header(session))
             
-            if session.get("bearer") and entry["auth_mode"] in [AUTH_AUTO, AUTH_BEARER, AUTH_BOTH]:
-                headers.append("Authorization: Bearer " + session["bearer"])
+            if session.get("bearer") and entry["auth_mode"] in BEARER_AUTH_MODES:
+                headers.append(self._bearer_header(session))
             
             body = json.dumps({"refresh_token": refresh_token}) if refresh_token else "{}"
             request = self._helpers.buildHttpMessage(headers, body)
@@ -2461,8 +3044,7 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
             self._log("Refresh error " + domain + ": " + str(e))
         
         finally:
-            with self.pending_refresh_lock:
-                self.pending_refresh.discard(domain)
+            self.pending_refresh.remove(domain)
     
     def _mirror_request(self, original_message, primary_domain):
         """Mirror request to mirrors"""
@@ -2480,46 +3062,39 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
                 self._log("ERROR: No response data!")
                 return
             
-            request_info = self._helpers.analyzeRequest(request)
-            url = request_info.getUrl()
-            path = url.getPath()
-            if url.getQuery():
-                path += "?" + url.getQuery()
-            
-            headers = request_info.getHeaders()
-            method = headers[0].split(" ")[0] if headers else "GET"
+            # Only the request line is needed - don't parse or split the rest
+            method, path = self._request_target(request)
+            method = method or "GET"
             
             self._log("Processing: " + method + " " + path)
             
             # Skip refresh endpoints
-            if any(p in path.lower() for p in self.refresh_patterns):
+            if self._is_refresh_path(path):
                 self._log("Skipping refresh endpoint")
                 return
             
-            response_info = self._helpers.analyzeResponse(response)
-            body_offset = response_info.getBodyOffset()
-            primary_body = self._helpers.bytesToString(response[body_offset:])
-            primary_hash = hashlib.md5(primary_body.encode('utf-8', errors='ignore')).hexdigest()
+            primary_status, body_offset = self._response_head(response)
+            # Bodies stay as bytes until a view needs the text (see _response_body)
+            primary_bytes = response[body_offset:]
+            primary_hash = self._body_hash(primary_bytes)
             
             result = {
                 "method": method,
                 "path": path,
-                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "timestamp": self._format_time("yyyy-MM-dd HH:mm:ss"),
                 "match": True,
                 "responses": {
-                    primary_domain: {
-                        "hash": primary_hash,
-                        "status": response_info.getStatusCode(),
-                        "size": len(primary_body),
-                        "body": primary_body
-                    }
+                    primary_domain: ResponseRecord(
+                        primary_status, len(primary_bytes), primary_hash,
+                        raw=primary_bytes)
                 }
             }
             
             mirrors = self._get_mirror_domains()
             self._log("Found " + str(len(mirrors)) + " mirror domains")
             
-            hashes = [primary_hash]
+            # Cleared by the first mirror whose body differs from the primary's
+            all_match = True
             
             for mirror_entry in mirrors:
                 mirror_domain = mirror_entry["domain"]
@@ -2567,24 +3142,19 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
                     
                     self._log("Got response from " + mirror_domain + " (" + str(len(resp_bytes)) + " bytes)")
                     
-                    mir_info = self._helpers.analyzeResponse(resp_bytes)
-                    mir_offset = mir_info.getBodyOffset()
-                    mir_body = self._helpers.bytesToString(resp_bytes[mir_offset:])
-                    mir_hash = hashlib.md5(mir_body.encode('utf-8', errors='ignore')).hexdigest()
+                    mir_status, mir_offset = self._response_head(resp_bytes)
+                    mir_bytes = resp_bytes[mir_offset:]
+                    mir_hash = self._body_hash(mir_bytes)
                     
-                    result["responses"][mirror_domain] = {
-                        "hash": mir_hash,
-                        "status": mir_info.getStatusCode(),
-                        "size": len(mir_body),
-                        "body": mir_body
-                    }
+                    result["responses"][mirror_domain] = ResponseRecord(
+                        mir_status, len(mir_bytes), mir_hash, raw=mir_bytes)
                     
-                    hashes.append(mir_hash)
+                    if mir_hash != primary_hash:
+                        all_match = False
                     
                     # Capture session from response
                     self._capture_from_response(mirror_domain, mirrored_req, resp_bytes, mirror_entry)
                     
-                    mir_status = mir_info.getStatusCode()
                     if mir_status in [301, 302, 303, 307, 308]:
                         self._log("Mirrored to " + mirror_domain + ": " + str(mir_status) + " (REDIRECT - session issue?)")
                     else:
@@ -2595,16 +3165,10 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
                     import traceback
                     traceback.print_exc()
             
-            result["match"] = len(set(hashes)) == 1
+            result["match"] = all_match
             
             self._add_result(result)
-            
-            def update_ui():
-                self._results_model.fireTableDataChanged()
-                if hasattr(self, '_update_results_count'):
-                    self._update_results_count()
-            
-            SwingUtilities.invokeLater(update_ui)
+            self._refresh_results_table()
             
             status = "MATCH" if result["match"] else "DIFF"
             self._log("Result: " + status + " " + method + " " + path[:50])
@@ -2619,52 +3183,75 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         # Manual parsing to avoid Burp API blocking issues
         self._debug_print("_build_mirrored_request called")
         
-        request_str = self._helpers.bytesToString(original_request)
-        
-        # Split headers and body
-        if "\r\n\r\n" in request_str:
-            header_section, body_str = request_str.split("\r\n\r\n", 1)
-            line_sep = "\r\n"
-        elif "\n\n" in request_str:
-            header_section, body_str = request_str.split("\n\n", 1)
-            line_sep = "\n"
-        else:
-            header_section = request_str
-            body_str = ""
-            line_sep = "\r\n"
+        # Split headers and body on the raw bytes - only the header block is
+        # decoded, and the body is passed through byte for byte
+        request_len = len(original_request)
+        line_sep = "\r\n"
+        header_end = self._helpers.indexOf(original_request, self._header_end_bytes, False, 0, request_len)
+        body_start = header_end + 4
+        if header_end < 0:
+            header_end = self._helpers.indexOf(original_request, self._lf_header_end_bytes, False, 0, request_len)
+            body_start = header_end + 2
+            if header_end >= 0:
+                line_sep = "\n"
+            else:
+                header_end = body_start = request_len
         
-        headers = header_section.split(line_sep)
-        body = body_str.encode('utf-8') if body_str else None
+        headers = self._helpers.bytesToString(original_request[:header_end]).split(line_sep)
+        body = original_request[body_start:] if body_start < request_len else None
         
-        self._debug_print("Parsed " + str(len(headers)) + " headers, body=" + str(len(body_str)) + " bytes")
+        self._debug_print("Parsed %s headers, body=%s bytes", len(headers), request_len - body_start)
         
         mirror_domain = mirror_entry["domain"]
         session = mirror_entry["session"]
         auth_mode = mirror_entry["auth_mode"]
         
-        # Debug: Show what session data we have for this mirror
-        self._debug_print("Mirror domain: " + mirror_domain)
-        self._debug_print("  Auth mode: " + str(auth_mode))
-        self._debug_print("  Session status: " + str(session.get("status", "unknown")))
-        self._debug_print("  Has cookies: " + str(bool(session.get("cookies"))))
-        if session.get("cookies"):
-            self._debug_print("  Cookie count: " + str(len(session["cookies"])))
-            self._debug_print("  Cookie names: " + ", ".join(session["cookies"].keys()))
-        self._debug_print("  Has bearer: " + str(bool(session.get("bearer"))))
-        
-        new_headers = []
+        # Debug: Show what session data we have for this mirror - gated here
+        # since building the arguments costs as much as printing them
+        if self.debug_mode:
+            self._debug_print("Mirror domain: %s", mirror_domain)
+            self._debug_print("  Auth mode: %s", auth_mode)
+            self._debug_print("  Session status: %s", session.get("status", "unknown"))
+            self._debug_print("  Has cookies: %s", bool(session.get("cookies")))
+            if session.get("cookies"):
+                self._debug_print("  Cookie count: %s", len(session["cookies"]))
+                self._debug_print("  Cookie names: %s", ", ".join(session["cookies"].keys()))
+            self._debug_print("  Has bearer: %s", bool(session.get("bearer")))
+        
+        new_headers = [headers[0]]
         has_auth = False
         has_cookie = False
-        
-        for i, header in enumerate(headers):
-            if i == 0:
+        has_custom = False
+        # Custom header settings are read once - the line only exists for
+        # custom mode with both a name and a value configured
+        custom_header_name = mirror_entry.get("custom_header_name", "")
+        custom_header_value = mirror_entry.get("custom_header_value", "")
+        custom_line = None
+        if auth_mode == AUTH_CUSTOM and custom_header_name and custom_header_value:
+            custom_line = custom_header_name + ": " + custom_header_value
+        custom_name = custom_header_name.lower()
+        # First characters of every header name rewritten below (an empty
+        # custom name can only match a line starting with ":")
+        custom_first = custom_name[:1] or ":"
+        rewrite_firsts = frozenset(["h", "H", "a", "A", "c", "C", custom_first, custom_first.upper()])
+        
+        # One pass over the headers - lines that can't be rewritten are copied
+        # as-is; the rest have their name lowercased once and dispatched on,
+        # instead of lowercasing the whole line per prefix test
+        for header in headers[1:]:
+            if header[:1] not in rewrite_firsts:
                 new_headers.append(header)
-            elif header.lower().startswith("host:"):
+                continue
+            colon = header.find(":")
+            name = header[:colon].lower() if colon >= 0 else None
+            if name is not None and name == custom_name:
+                has_custom = True
+            if name == "host":
                 new_headers.append("Host: " + mirror_domain)
-            elif header.lower().startswith("authorization:"):
+            elif name == "authorization":
                 has_auth = True
-                if auth_mode in [AUTH_AUTO, AUTH_BEARER, AUTH_BOTH] and session.get("bearer"):
-                    new_headers.append("Authorization: Bearer " + session["bearer"])
+                if auth_mode in BEARER_AUTH_MODES and session.get("bearer"):
+                    new_headers.append(self._bearer_header(session))
                     self._debug_print("  Using mirror's bearer token")
                 elif auth_mode == AUTH_NONE:
                     self._debug_print("  Skipping auth (mode=NONE)")
@@ -2675,12 +3262,12 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
                 else:
                     new_headers.append(header)
                     self._debug_print("  WARNING: Using original auth header (no mirror token)")
-            elif header.lower().startswith("cookie:"):
+            elif name == "cookie":
                 has_cookie = True
-                if auth_mode in [AUTH_AUTO, AUTH_COOKIES, AUTH_BOTH] and session.get("cookies"):
-                    cookie_str = "; ".join([k + "=" + v for k, v in session["cookies"].items()])
-                    new_headers.append("Cookie: " + cookie_str)
-                    self._debug_print("  Using mirror's cookies: " + cookie_str[:100] + "...")
+                if auth_mode in COOKIE_AUTH_MODES and session.get("cookies"):
+                    cookie_header = self._cookie_header(session)
+                    new_headers.append(cookie_header)
+                    self._debug_print("  Using mirror's cookies: %s...", cookie_header[8:108])
                 elif auth_mode == AUTH_NONE:
                     self._debug_print("  Skipping cookies (mode=NONE)")
                     pass  # Don't add cookies
@@ -2690,45 +3277,37 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
                 else:
                     # WARNING: This uses the PRIMARY domain's cookies!
                     self._debug_print("  WARNING: No mirror cookies - using original (primary) cookies!")
-                    self._debug_print("  Original cookie: " + header[:100])
+                    self._debug_print("  Original cookie: %s", header[:100])
                     new_headers.append(header)
-            elif header.lower().startswith(mirror_entry.get("custom_header_name", "").lower() + ":"):
+            elif name is not None and name == custom_name:
                 # Replace custom header if configured
-                if auth_mode == AUTH_CUSTOM and mirror_entry.get("custom_header_value"):
-                    new_headers.append(mirror_entry["custom_header_name"] + ": " + mirror_entry["custom_header_value"])
-                else:
-                    new_headers.append(header)
+                new_headers.append(custom_line or header)
             else:
                 new_headers.append(header)
         
         # Add missing auth based on mode
-        if auth_mode in [AUTH_AUTO, AUTH_BEARER, AUTH_BOTH]:
+        if auth_mode in BEARER_AUTH_MODES:
             if not has_auth and session.get("bearer"):
-                new_headers.append("Authorization: Bearer " + session["bearer"])
+                new_headers.append(self._bearer_header(session))
                 self._debug_print("  Added missing bearer token")
         
-        if auth_mode in [AUTH_AUTO, AUTH_COOKIES, AUTH_BOTH]:
+        if auth_mode in COOKIE_AUTH_MODES:
             if not has_cookie and session.get("cookies"):
-                cookie_str = "; ".join([k + "=" + v for k, v in session["cookies"].items()])
-                new_headers.append("Cookie: " + cookie_str)
-                self._debug_print("  Added missing cookies: " + cookie_str[:100] + "...")
-        
-        if auth_mode == AUTH_CUSTOM:
-            header_name = mirror_entry.get("custom_header_name", "")
-            header_value = mirror_entry.get("custom_header_value", "")
-            if header_name and header_value:
-                # Check if already added
-                has_custom = any(h.lower().startswith(header_name.lower() + ":") for h in new_headers)
-                if not has_custom:
-                    new_headers.append(header_name + ": " + header_value)
+                cookie_header = self._cookie_header(session)
+                new_headers.append(cookie_header)
+                self._debug_print("  Added missing cookies: %s...", cookie_header[8:108])
+        
+        if custom_line is not None and not has_custom:
+            new_headers.append(custom_line)
         
         # Add internal marker header to prevent infinite loops when "Extensions" is enabled
-        new_headers.append("X-DomainMirror-Internal: true")
+        new_headers.append(MIRROR_MARKER_HEADER)
         
         return self._helpers.buildHttpMessage(new_headers, body)
     
-    def _mirror_request_v2(self, request_bytes, response_bytes, primary_host, protocol, port, mirrors):
-        """Mirror request to mirrors - using raw bytes"""
+    def _mirror_request_v2(self, request_bytes, response_bytes, primary_host, protocol, port, mirrors, log_prefix=""):
+        """Mirror request to mirrors - using raw bytes. log_prefix tags the
+        MIRRORING log line with the source tool (empty for Proxy)"""
         try:
             self._debug_print("_mirror_request_v2 started")
             
@@ -2738,51 +3317,55 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
             
             # Parse request manually to avoid Burp API blocking issues
             self._debug_print("Parsing request manually...")
-            request_str = self._helpers.bytesToString(request_bytes)
-            lines = request_str.split("\r\n") if "\r\n" in request_str else request_str.split("\n")
             
             # First line: "GET /path HTTP/1.1"
-            first_line = lines[0] if lines else "GET / HTTP/1.1"
-            parts = first_line.split(" ")
-            method = parts[0] if len(parts) >= 1 else "GET"
-            path = parts[1] if len(parts) >= 2 else "/"
+            method, path = self._request_target(request_bytes)
+            method = method or "GET"
+            if not path:
+                path = "/"
             
-            self._debug_print("Processing: " + method + " " + path)
+            self._debug_print("Processing: %s %s", method, path)
             
-            # Skip refresh endpoints
-            if any(p in path.lower() for p in self.refresh_patterns):
+            # Skip refresh endpoints - matched on the path alone, as in capture,
+            # so a query string mentioning one doesn't skip the request
+            query = path.find("?")
+            if self._is_refresh_path(path[:query] if query >= 0 else path):
                 self._debug_print("Skipping refresh endpoint")
                 return
             
-            # Calculate primary response hash - analyzeResponse seems to work fine
+            self._log(log_prefix + ">>> MIRRORING: " + path + " to " + str(len(mirrors)) + " mirror(s)")
+            
+            # Calculate primary response hash
             self._debug_print("Analyzing response...")
-            response_info = self._helpers.analyzeResponse(response_bytes)
-            body_offset = response_info.getBodyOffset()
-            primary_body = self._helpers.bytesToString(response_bytes[body_offset:])
-            primary_hash = hashlib.md5(primary_body.encode('utf-8', errors='ignore')).hexdigest()
+            primary_status, body_offset = self._response_head(response_bytes)
+            # Bodies stay as bytes until a view needs the text (see _response_body)
+            primary_bytes = response_bytes[body_offset:]
+            primary_hash = self._body_hash(primary_bytes)
             self._debug_print("Response analyzed OK")
             
             result = {
                 "method": method,
                 "path": path,
-                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "timestamp": self._format_time("yyyy-MM-dd HH:mm:ss"),
                 "match": True,
                 "responses": {
-                    primary_host: {
-                        "hash": primary_hash,
-                        "status": response_info.getStatusCode(),
-                        "size": len(primary_body),
-                        "body": primary_body
-                    }
+                    primary_host: ResponseRecord(
+                        primary_status, len(primary_bytes), primary_hash,
+                        raw=primary_bytes)
                 }
             }
             
-            self._debug_print("Primary response: status=" + str(response_info.getStatusCode()) + ", hash=" + primary_hash[:8])
+            self._debug_print("Primary response: status=%s, hash=%s", primary_status, primary_hash[:8])
             
-            hashes = [primary_hash]
+            # Cleared by the first mirror whose body differs from the primary's
+            all_match = True
             use_https = (protocol == "https")
             
-            # Mirror to each domain
+            # Send to every mirror at once - the requests run concurrently on
+            # the HTTP pool, so the wait is the slowest mirror, not the sum
+            mirror_port = 443 if use_https else 80
+            deadline = time.time() + self._request_timeout
+            pending = []
             for mirror_entry in mirrors:
                 mirror_domain = mirror_entry["domain"]
                 mirror_session = mirror_entry["session"]
@@ -2791,55 +3374,70 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
                 if not mirror_session.get("cookies") and not mirror_session.get("bearer"):
                     self._log("WARNING: " + mirror_domain + " has no captured session! May get 302 redirects.")
                 
-                self._debug_print("Mirroring to: " + mirror_domain)
+                self._debug_print("Mirroring to: %s", mirror_domain)
                 
                 try:
                     # Build mirrored request
                     mirrored_req = self._build_mirrored_request(request_bytes, mirror_entry)
                     
                     if not mirrored_req:
-                        self._debug_print("Failed to build request for " + mirror_domain)
+                        self._debug_print("Failed to build request for %s", mirror_domain)
                         continue
                     
-                    # Determine port
-                    mirror_port = 443 if use_https else 80
-                    
-                    self._debug_print("Sending to " + mirror_domain + ":" + str(mirror_port))
+                    self._debug_print("Sending to %s:%s", mirror_domain, mirror_port)
                     
-                    # Make request with timeout
                     mirror_service = self._helpers.buildHttpService(mirror_domain, mirror_port, use_https)
-                    mirror_resp, error = self._make_request_with_timeout(mirror_service, mirrored_req, self._request_timeout)
+                    pending.append((mirror_entry, mirrored_req, self._start_request(mirror_service, mirrored_req)))
+                
+                except Exception as e:
+                    self._debug_print("Exception mirroring to %s: %s", mirror_domain, e)
+                    import traceback
+                    traceback.print_exc()
+            
+            # Collect in mirror order, so results and logs keep the configured order
+            for mirror_entry, mirrored_req, future in pending:
+                mirror_domain = mirror_entry["domain"]
+                
+                try:
+                    mirror_resp, error = self._await_request(future, self._request_timeout, deadline)
                     
                     if error:
-                        self._debug_print("Request error: " + error)
+                        self._debug_print("Request error: %s", error)
                         self._log("Mirror error for " + mirror_domain + ": " + error)
                         continue
                     
                     if not mirror_resp:
-                        self._debug_print("No response from " + mirror_domain)
+                        self._debug_print("No response from %s", mirror_domain)
                         continue
                     
                     resp_bytes = mirror_resp.getResponse()
                     if not resp_bytes:
-                        self._debug_print("Empty response from " + mirror_domain)
+                        self._debug_print("Empty response from %s", mirror_domain)
                         continue
                     
-                    mir_info = self._helpers.analyzeResponse(resp_bytes)
-                    mir_offset = mir_info.getBodyOffset()
-                    mir_body = self._helpers.bytesToString(resp_bytes[mir_offset:])
-                    mir_hash = hashlib.md5(mir_body.encode('utf-8', errors='ignore')).hexdigest()
-                    mir_status = mir_info.getStatusCode()
+                    mir_status, mir_offset = self._response_head(resp_bytes)
+                    mir_end = len(resp_bytes)
+                    # Byte-identical bodies (the common case) are compared in
+                    # place, skip hashing, and share the primary's array, so
+                    # the mirror body is never copied out or kept twice.
+                    # ByteBuffer views rather than the ranged Arrays.equals,
+                    # which needs Java 9
+                    if (mir_end - mir_offset == len(primary_bytes) and
+                            ByteBuffer.wrap(primary_bytes).equals(
+                                ByteBuffer.wrap(resp_bytes, mir_offset, mir_end - mir_offset))):
+                        mir_bytes = primary_bytes
+                        mir_hash = primary_hash
+                    else:
+                        mir_bytes = resp_bytes[mir_offset:]
+                        mir_hash = self._body_hash(mir_bytes)
                     
-                    self._debug_print("Mirror response: status=" + str(mir_status) + ", hash=" + mir_hash[:8])
+                    self._debug_print("Mirror response: status=%s, hash=%s", mir_status, mir_hash[:8])
                     
-                    result["responses"][mirror_domain] = {
-                        "hash": mir_hash,
-                        "status": mir_status,
-                        "size": len(mir_body),
-                        "body": mir_body
-                    }
+                    result["responses"][mirror_domain] = ResponseRecord(
+                        mir_status, len(mir_bytes), mir_hash, raw=mir_bytes)
                     
-                    hashes.append(mir_hash)
+                    if mir_hash != primary_hash:
+                        all_match = False
                     
                     # Capture session from response
                     try:
@@ -2854,30 +3452,24 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
                         self._log("Mirrored to " + mirror_domain + ": " + str(mir_status))
                 
                 except Exception as e:
-                    self._debug_print("Exception mirroring to " + mirror_domain + ": " + str(e))
+                    self._debug_print("Exception mirroring to %s: %s", mirror_domain, e)
                     import traceback
                     traceback.print_exc()
             
-            # Check if all match
-            result["match"] = len(set(hashes)) == 1
+            result["match"] = all_match
             
             # Add to results (with automatic cleanup)
             self._add_result(result)
             
-            # Update UI
-            def update_ui_v2():
-                self._results_model.fireTableDataChanged()
-                if hasattr(self, '_update_results_count'):
-                    self._update_results_count()
-            
-            SwingUtilities.invokeLater(update_ui_v2)
+            # Update UI (coalesced with other results arriving in the same burst)
+            self._refresh_results_table()
             
             status = "MATCH" if result["match"] else "DIFF"
             self._log("Result: " + status + " " + method + " " + path[:50])
-            self._debug_print("Complete: " + status)
+            self._debug_print("Complete: %s", status)
         
         except Exception as e:
-            self._debug_print("EXCEPTION: " + str(e))
+            self._debug_print("EXCEPTION: %s", e)
             import traceback
             traceback.print_exc()
     
@@ -2887,8 +3479,7 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
         self._log("MANUAL MIRROR TEST")
         self._log("=" * 40)
         
-        primary = self._get_primary_domain()
-        mirrors = self._get_mirror_domains()
+        primary, mirrors = self._topology
         
         if not primary:
             self._log("ERROR: No primary domain configured!")
@@ -2912,9 +3503,9 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
             self._log("Test complete!")
             self._log("=" * 40)
         
-        t = Thread(target=run_test)
-        t.daemon = True
-        t.start()
+        if not self._submit_background(run_test):
+            self._log("ERROR: Worker pool busy, try again shortly")
+            return
         
         JOptionPane.showMessageDialog(self._main_panel, "Test started! Watch the Logs tab.\nNote: Each request has a 10 second timeout.")
     
@@ -2939,16 +3530,15 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
                 ]
                 
                 session = mirror_entry["session"]
-                auth_mode = mirror_entry.get("auth_mode", "Auto Detect")
+                auth_mode = mirror_entry.get("auth_mode", AUTH_AUTO)
                 
-                if auth_mode in ["Auto Detect", "Bearer Only", "Cookies + Bearer"]:
+                if auth_mode in BEARER_AUTH_MODES:
                     if session.get("bearer"):
                         headers.append("Authorization: Bearer " + session["bearer"][:50] + "...")
                 
-                if auth_mode in ["Auto Detect", "Cookies Only", "Cookies + Bearer"]:
+                if auth_mode in COOKIE_AUTH_MODES:
                     if session.get("cookies"):
-                        cookie_str = "; ".join([k + "=" + v for k, v in session["cookies"].items()])
-                        headers.append("Cookie: " + cookie_str)
+                        headers.append(self._cookie_header(session))
                 
                 request = self._helpers.buildHttpMessage(headers, None)
                 
@@ -2970,16 +3560,13 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
             finally:
                 result["done"] = True
         
-        # Start request thread
-        request_thread = Thread(target=do_request)
-        request_thread.daemon = True  # Allow JVM to exit
-        request_thread.start()
-        
-        # Wait with timeout (10 seconds)
+        # Run on the HTTP pool and block until it finishes or times out (10 seconds)
         timeout = 10
-        start = time.time()
-        while not result["done"] and (time.time() - start) < timeout:
-            time.sleep(0.5)
+        future = self._http_exec.submit(CallableTask(do_request))
+        try:
+            future.get(timeout, TimeUnit.SECONDS)
+        except TimeoutException:
+            pass
         
         if not result["done"]:
             self._log("  TIMEOUT after " + str(timeout) + " seconds!")
@@ -2996,30 +3583,311 @@ class BurpExtender(IBurpExtender, ITab, IProxyListener, IHttpListener):
     
     def _make_request_with_timeout(self, service, request, timeout_seconds=10):
         """Make HTTP request with timeout - returns (response, error_message)"""
-        result = {"response": None, "error": None, "done": False}
+        return self._await_request(self._start_request(service, request), timeout_seconds)
+    
+    def _start_request(self, service, request):
+        """Send request on the HTTP pool - returns a Future of (response, error_message)"""
+        request_key = self._request_key(request)
         
         def do_request():
+            self._our_mirror_requests.merge(request_key, 1, lambda count, one: count + one)
             try:
-                result["response"] = self._callbacks.makeHttpRequest(service, request)
+                return (self._callbacks.makeHttpRequest(service, request), None)
             except Exception as e:
-                result["error"] = str(e)
+                return (None, str(e))
             finally:
-                result["done"] = True
+                # Returning None removes the key once the count reaches zero
+                self._our_mirror_requests.computeIfPresent(
+                    request_key, lambda key, count: count - 1 if count > 1 else None)
         
-        t = Thread(target=do_request)
-        t.daemon = True  # Allow JVM to exit even if thread is hanging
-        t.start()
-        
-        start = time.time()
-        while not result["done"] and (time.time() - start) < timeout_seconds:
-            time.sleep(0.1)
-        
-        if not result["done"]:
+        return self._http_exec.submit(CallableTask(do_request))
+    
+    def _await_request(self, future, timeout_seconds, deadline=None):
+        """Wait for a _start_request future until deadline (default: timeout_seconds from now)"""
+        if deadline is None:
+            deadline = time.time() + timeout_seconds
+        try:
+            wait_ms = max(0, int((deadline - time.time()) * 1000))
+            return future.get(wait_ms, TimeUnit.MILLISECONDS)
+        except TimeoutException:
             return (None, "TIMEOUT after " + str(timeout_seconds) + "s")
-        elif result["error"]:
-            return (None, result["error"])
+
+
+# === Result Storage ===
+
+class ResultStore(object):
+    """Fixed-capacity ring buffer of results - adding when full evicts the oldest.
+    
+    The table columns are kept in parallel slot lists filled once per add, so
+    rendering and sorting never touch the result dicts (and their bodies).
+    Not thread-safe; callers hold the results write lock to modify it and the
+    read lock for multi-step reads."""
+    
+    def __init__(self, capacity):
+        self._reset(capacity)
+        self._evicted = 0  # Total results add() has pushed out, never reset
+    
+    def _reset(self, capacity):
+        self._slots = [None] * capacity  # Full result dicts
+        self._methods = [None] * capacity
+        self._paths = [None] * capacity  # Truncated for display
+        self._matches = [False] * capacity
+        self._domain_counts = [0] * capacity
+        self._times = [None] * capacity  # Time part of the timestamp
+        self._head = 0  # Slot of the oldest result
+        self._size = 0
+        self._mismatches = 0
+    
+    def _slot(self, index):
+        if index < 0 or index >= self._size:
+            raise IndexError("result index out of range: " + str(index))
+        # Called for every rendered cell - wrap with a compare, not a modulo
+        slot = self._head + index
+        capacity = len(self._slots)
+        return slot - capacity if slot >= capacity else slot
+    
+    def size(self):
+        return self._size
+    
+    def capacity(self):
+        return len(self._slots)
+    
+    def mismatch_count(self):
+        return self._mismatches
+    
+    def evicted_count(self):
+        return self._evicted
+    
+    def get(self, index):
+        """Return the result at index (0 = oldest)"""
+        return self._slots[self._slot(index)]
+    
+    def method(self, index):
+        return self._methods[self._slot(index)]
+    
+    def display_path(self, index):
+        return self._paths[self._slot(index)]
+    
+    def is_match(self, index):
+        return self._matches[self._slot(index)]
+    
+    def domain_count(self, index):
+        return self._domain_counts[self._slot(index)]
+    
+    def time(self, index):
+        return self._times[self._slot(index)]
+    
+    def _ordered(self, column):
+        """Return a column's live entries oldest-first as a new list (at most two slices)"""
+        end = self._head + self._size
+        if end <= len(column):
+            return column[self._head:end]
+        return column[self._head:] + column[:end - len(column)]
+    
+    def snapshot(self):
+        """Return the results oldest-first as a new list"""
+        return self._ordered(self._slots)
+    
+    def add(self, result):
+        """Append result - returns True if the oldest result was evicted"""
+        capacity = len(self._slots)
+        evicted = self._size == capacity
+        if evicted:
+            slot = self._head
+            if not self._matches[slot]:
+                self._mismatches -= 1
+            self._head = (self._head + 1) % capacity
+            self._evicted += 1
+        else:
+            slot = (self._head + self._size) % capacity
+            self._size += 1
+        
+        path = result.get("path", "")
+        ts = result.get("timestamp", "")
+        match = bool(result.get("match"))
+        
+        self._slots[slot] = result
+        self._methods[slot] = result.get("method", "")
+        self._paths[slot] = path[:55] + "..." if len(path) > 55 else path
+        self._matches[slot] = match
+        self._domain_counts[slot] = len(result.get("responses", {}))
+        self._times[slot] = ts.split(" ")[1] if " " in ts else ts
+        if not match:
+            self._mismatches += 1
+        return evicted
+    
+    def clear(self):
+        self._reset(len(self._slots))
+    
+    def set_capacity(self, capacity):
+        """Resize, keeping the newest results - returns True if any were evicted"""
+        if capacity == len(self._slots):
+            return False
+        old_size = self._size
+        keep = min(old_size, capacity)
+        start = old_size - keep
+        # Move the newest entries of every column to the front of the new
+        # lists as-is, rather than re-deriving the display columns via add()
+        kept = [self._ordered(column)[start:] for column in (
+            self._slots, self._methods, self._paths, self._matches, self._domain_counts, self._times)]
+        self._reset(capacity)
+        for column, values in zip((
+                self._slots, self._methods, self._paths, self._matches, self._domain_counts, self._times), kept):
+            column[:keep] = values
+        self._size = keep
+        self._mismatches = kept[3].count(False)
+        return keep < old_size
+    
+
+class ResponseRecord(object):
+    """One domain's stored response. The fields are fixed, so they live in
+    __slots__ - no per-response dict, and reads are slot lookups.
+    body stays None until decoded from raw on first use (see _response_body)."""
+    
+    __slots__ = ("status", "size", "hash", "body", "raw", "lines", "summary", "summary_row", "header_line")
+    
+    def __init__(self, status, size, body_hash, body=None, raw=None):
+        self.status = status
+        self.size = size
+        self.hash = body_hash
+        self.body = body
+        self.raw = raw
+        self.lines = None  # Body split into lines, cached on first use (see _body_lines)
+        # Display strings never change after capture, so build them once:
+        # (status, size, hash), the Summary tab table columns and the
+        # side-by-side pane header
+        self.summary = (str(status), str(size), body_hash)
+        self.summary_row = "{:>8} {:>10} {:>15}".format(self.summary[0], self.summary[1], body_hash[:15])
+        self.header_line = "Status: {} | Size: {} | Hash: {}".format(self.summary[0], self.summary[1], body_hash[:12])
+    
+    def to_json(self, body):
+        """Session-file dict for this response, with the given decoded body"""
+        return {"status": self.status, "size": self.size, "hash": self.hash, "body": body}
+    
+    @staticmethod
+    def from_json(data):
+        """Rebuild a response from its session-file dict"""
+        return ResponseRecord(data.get("status", "?"), data.get("size", 0), data.get("hash", ""),
+                              body=data.get("body") or "")
+
+
+# === Diff Rendering ===
+
+class TrimmedSequenceMatcher(difflib.SequenceMatcher):
+    """SequenceMatcher that matches the common head and tail directly and only
+    runs the matching search over the part in between. Mirrored responses
+    usually differ in a small region, so this skips most of the work."""
+    
+    def get_matching_blocks(self):
+        if self.matching_blocks is not None:
+            return self.matching_blocks
+        a, b = self.a, self.b
+        la, lb = len(a), len(b)
+        shorter = min(la, lb)
+        head = 0
+        while head < shorter and a[head] == b[head]:
+            head += 1
+        tail = 0
+        while tail < shorter - head and a[la - 1 - tail] == b[lb - 1 - tail]:
+            tail += 1
+        
+        blocks = []
+        if head:
+            blocks.append((0, 0, head))
+        middle = difflib.SequenceMatcher(self.isjunk, a[head:la - tail], b[head:lb - tail], self.autojunk)
+        for i, j, size in middle.get_matching_blocks()[:-1]:
+            block = (i + head, j + head, size)
+            # Keep blocks maximal - merge one that continues the previous block
+            if blocks and blocks[-1][0] + blocks[-1][2] == block[0] and blocks[-1][1] + blocks[-1][2] == block[1]:
+                blocks[-1] = (blocks[-1][0], blocks[-1][1], blocks[-1][2] + size)
+            else:
+                blocks.append(block)
+        if tail:
+            block = (la - tail, lb - tail, tail)
+            if blocks and blocks[-1][0] + blocks[-1][2] == block[0] and blocks[-1][1] + blocks[-1][2] == block[1]:
+                blocks[-1] = (blocks[-1][0], blocks[-1][1], blocks[-1][2] + tail)
+            else:
+                blocks.append(block)
+        blocks.append((la, lb, 0))
+        self.matching_blocks = blocks
+        return blocks
+
+
+class StyledTextBuffer(object):
+    """Accumulates text as one buffer plus (style_name, length) runs -
+    consecutive writes in the same style extend a single run"""
+    
+    def __init__(self):
+        self._parts = []
+        self._runs = []  # [style_name, length] pairs
+    
+    def write(self, text, style_name):
+        """Append text in the given style"""
+        if not text:
+            return
+        self._parts.append(text)
+        if self._runs and self._runs[-1][0] == style_name:
+            self._runs[-1][1] += len(text)
         else:
-            return (result["response"], None)
+            self._runs.append([style_name, len(text)])
+    
+    def write_line(self, line, style_name):
+        """Append a line plus its newline in the given style"""
+        self.write(line, style_name)
+        self.write("\n", style_name)
+    
+    def write_lines(self, lines, style_name):
+        """Append lines, each with its newline, in the given style as one write"""
+        if lines:
+            self.write("\n".join(lines) + "\n", style_name)
+    
+    def write_segments(self, segments):
+        """Append (text, style_name) segments"""
+        for text, style_name in segments:
+            self.write(text, style_name)
+    
+    def write_buffer(self, other):
+        """Append another buffer's content (other is left unchanged)"""
+        text = other.text()
+        offset = 0
+        for style_name, length in other.runs():
+            self.write(text[offset:offset + length], style_name)
+            offset += length
+    
+    def text(self):
+        """The accumulated text"""
+        if len(self._parts) > 1:
+            self._parts = ["".join(self._parts)]
+        return self._parts[0] if self._parts else ""
+    
+    def runs(self):
+        """The style runs as (style_name, length) tuples, in text order"""
+        return [tuple(run) for run in self._runs]
+
+
+# === Worker Threads ===
+
+class DaemonThreadFactory(ThreadFactory):
+    """Creates named daemon threads so pooled workers never block Burp exit"""
+    
+    def __init__(self, name_prefix):
+        self._name_prefix = name_prefix
+        self._counter = AtomicInteger(0)
+    
+    def newThread(self, runnable):
+        t = java.lang.Thread(runnable, self._name_prefix + "-" + str(self._counter.incrementAndGet()))
+        t.setDaemon(True)
+        return t
+
+
+class CallableTask(Callable):
+    """Wraps a Python function as a java.util.concurrent.Callable"""
+    
+    def __init__(self, fn):
+        self._fn = fn
+    
+    def call(self):
+        return self._fn()
 
 
 # === Domain Config Dialog ===
@@ -3207,6 +4075,21 @@ class DomainsComparator(Comparator):
             return 0
 
 
+class MatchRowFilter(RowFilter):
+    """Show only matching (or only mismatching) results"""
+    def __init__(self, results, want_match):
+        self._results = results
+        self._want = want_match
+    
+    def include(self, entry):
+        # Model row -> stored match flag directly, instead of rendering the
+        # Match cell through getValueAt and the sorter's string converter
+        try:
+            return self._results.is_match(entry.getIdentifier()) == self._want
+        except IndexError:
+            return False  # Store shrank before the next sync
+
+
 class DomainTableModel(AbstractTableModel):
     """Domain table model"""
     
@@ -3252,34 +4135,67 @@ class DomainTableModel(AbstractTableModel):
             return ", ".join(parts) if parts else "(none)"
         elif col == 5:
             last = session.get("last_updated")
-            return time.strftime("%H:%M:%S", time.localtime(last)) if last else "-"
+            return self._extender._format_time("HH:mm:ss", last) if last else "-"
         
         return ""
 
 
 class ResultsTableModel(AbstractTableModel):
-    """Results table model"""
+    """Results table model - rows map 1:1 to extender.results, filtering is done by the sorter"""
     
     COLUMNS = ["#", "Method", "Path", "Match", "Domains", "Time"]
     
     def __init__(self, extender):
         self._extender = extender
+        # Row count, generation and eviction count last published to the table (EDT only)
+        self._row_count = 0
+        self._generation = 0
+        self._evicted = 0
+    
+    def sync(self):
+        """Publish result list changes to the table - must run on the EDT"""
+        ext = self._extender
+        ext._results_read_lock.lock()
+        try:
+            size = ext.results.size()
+            generation = ext._results_generation
+            evicted = ext.results.evicted_count()
+        finally:
+            ext._results_read_lock.unlock()
+        
+        old_count = self._row_count
+        # Rows evicted before they were ever published need no event
+        dropped = min(evicted - self._evicted, old_count)
+        self._evicted = evicted
+        
+        if generation != self._generation:
+            self._generation = generation
+            self._row_count = size
+            if size == 0 and old_count > 0:
+                self.fireTableRowsDeleted(0, old_count - 1)
+            else:
+                self.fireTableDataChanged()
+            return
+        
+        if dropped and dropped == old_count:
+            # Every published row was pushed out
+            self._row_count = size
+            self.fireTableDataChanged()
+            return
+        if dropped > 0:
+            # The ring buffer evicts oldest-first, i.e. from row 0
+            old_count -= dropped
+            self._row_count = old_count
+            self.fireTableRowsDeleted(0, dropped - 1)
+        
+        self._row_count = size
+        if size > old_count:
+            self.fireTableRowsInserted(old_count, size - 1)
+        elif size < old_count:
+            self.fireTableDataChanged()
     
     def getRowCount(self):
-        filter_val = "All"
-        if hasattr(self._extender, '_filter_combo') and self._extender._filter_combo:
-            filter_val = self._extender._filter_combo.getSelectedItem()
-        
-        count = 0
-        for i in range(self._extender.results.size()):
-            r = self._extender.results.get(i)
-            if filter_val == "All":
-                count += 1
-            elif filter_val == "Mismatches Only" and not r.get("match"):
-                count += 1
-            elif filter_val == "Matches Only" and r.get("match"):
-                count += 1
-        return count
+        return self._row_count
     
     def getColumnCount(self):
         return len(self.COLUMNS)
@@ -3288,106 +4204,107 @@ class ResultsTableModel(AbstractTableModel):
         return self.COLUMNS[col]
     
     def getValueAt(self, row, col):
-        filter_val = "All"
-        if hasattr(self._extender, '_filter_combo') and self._extender._filter_combo:
-            filter_val = self._extender._filter_combo.getSelectedItem()
-        
-        filtered_idx = 0
-        actual_idx = -1
-        
-        for i in range(self._extender.results.size()):
-            r = self._extender.results.get(i)
-            include = (filter_val == "All" or
-                      (filter_val == "Mismatches Only" and not r.get("match")) or
-                      (filter_val == "Matches Only" and r.get("match")))
-            if include:
-                if filtered_idx == row:
-                    actual_idx = i
-                    break
-                filtered_idx += 1
-        
-        if actual_idx < 0:
-            return ""
-        
-        result = self._extender.results.get(actual_idx)
-        
-        if col == 0:
-            return str(actual_idx + 1)
-        elif col == 1:
-            return result.get("method", "")
-        elif col == 2:
-            p = result.get("path", "")
-            return p[:55] + "..." if len(p) > 55 else p
-        elif col == 3:
-            return "YES" if result.get("match") else "NO"
-        elif col == 4:
-            return str(len(result.get("responses", {}))) + " domains"
-        elif col == 5:
-            ts = result.get("timestamp", "")
-            return ts.split(" ")[1] if " " in ts else ts
+        results = self._extender.results
+        try:
+            if col == 0:
+                return str(row + 1)
+            elif col == 1:
+                return results.method(row)
+            elif col == 2:
+                return results.display_path(row)
+            elif col == 3:
+                return "YES" if results.is_match(row) else "NO"
+            elif col == 4:
+                return str(results.domain_count(row)) + " domains"
+            elif col == 5:
+                return results.time(row)
+        except IndexError:
+            return ""  # Store shrank before the next sync
         
         return ""
 
 
+# === Listeners ===
+
+class AdjustmentCallback(AdjustmentListener):
+    """Forwards scrollbar adjustment events to a Python callback"""
+    
+    def __init__(self, callback):
+        self._callback = callback
+    
+    def adjustmentValueChanged(self, e):
+        self._callback(e)
+
+
 # === Renderers ===
 
 class StatusCellRenderer(DefaultTableCellRenderer):
+    # (background, foreground) per status - built once, not per painted cell
+    COLORS = {
+        "READY": (Color(200, 255, 200), Color(0, 100, 0)),
+        "CAPTURING": (Color(255, 255, 200), Color(150, 100, 0)),
+    }
+    OTHER = (Color(255, 220, 220), Color(150, 0, 0))
+    
+    def __init__(self):
+        DefaultTableCellRenderer.__init__(self)
+        self.setHorizontalAlignment(SwingConstants.CENTER)
+    
     def getTableCellRendererComponent(self, table, value, isSelected, hasFocus, row, col):
         c = DefaultTableCellRenderer.getTableCellRendererComponent(self, table, value, isSelected, hasFocus, row, col)
         
-        if value == "READY":
-            c.setBackground(Color(200, 255, 200))
-            c.setForeground(Color(0, 100, 0))
-        elif value == "CAPTURING":
-            c.setBackground(Color(255, 255, 200))
-            c.setForeground(Color(150, 100, 0))
-        else:
-            c.setBackground(Color(255, 220, 220))
-            c.setForeground(Color(150, 0, 0))
-        
-        if isSelected:
-            c.setBackground(table.getSelectionBackground())
-        
-        self.setHorizontalAlignment(SwingConstants.CENTER)
+        background, foreground = self.COLORS.get(value, self.OTHER)
+        c.setBackground(table.getSelectionBackground() if isSelected else background)
+        c.setForeground(foreground)
         return c
 
 
 class AuthModeCellRenderer(DefaultTableCellRenderer):
+    COLORS = {
+        AUTH_AUTO: Color(230, 230, 255),
+        AUTH_COOKIES: Color(255, 240, 220),
+        AUTH_BEARER: Color(220, 255, 220),
+        AUTH_BOTH: Color(255, 220, 255),
+        AUTH_NONE: Color(240, 240, 240),
+        AUTH_CUSTOM: Color(255, 255, 200)
+    }
+    
     def getTableCellRendererComponent(self, table, value, isSelected, hasFocus, row, col):
         c = DefaultTableCellRenderer.getTableCellRendererComponent(self, table, value, isSelected, hasFocus, row, col)
         
-        colors = {
-            AUTH_AUTO: Color(230, 230, 255),
-            AUTH_COOKIES: Color(255, 240, 220),
-            AUTH_BEARER: Color(220, 255, 220),
-            AUTH_BOTH: Color(255, 220, 255),
-            AUTH_NONE: Color(240, 240, 240),
-            AUTH_CUSTOM: Color(255, 255, 200)
-        }
-        
-        c.setBackground(colors.get(value, Color.WHITE))
+        c.setBackground(table.getSelectionBackground() if isSelected else self.COLORS.get(value, Color.WHITE))
         c.setForeground(Color.BLACK)
-        
-        if isSelected:
-            c.setBackground(table.getSelectionBackground())
-        
         return c
 
 
 class MatchCellRenderer(DefaultTableCellRenderer):
+    YES = (Color(200, 255, 200), Color(0, 100, 0))
+    NO = (Color(255, 180, 180), Color(150, 0, 0))
+    
+    def __init__(self):
+        DefaultTableCellRenderer.__init__(self)
+        self.setHorizontalAlignment(SwingConstants.CENTER)
+        self._bold = (None, None)  # (table font, its bold derivation)
+    
     def getTableCellRendererComponent(self, table, value, isSelected, hasFocus, row, col):
         c = DefaultTableCellRenderer.getTableCellRendererComponent(self, table, value, isSelected, hasFocus, row, col)
         
         if value == "YES":
-            c.setBackground(Color(200, 255, 200))
-            c.setForeground(Color(0, 100, 0))
+            colors = self.YES
         elif value == "NO":
-            c.setBackground(Color(255, 180, 180))
-            c.setForeground(Color(150, 0, 0))
-            c.setFont(c.getFont().deriveFont(Font.BOLD))
+            colors = self.NO
+            # The superclass resets the font to the table's on every call, so
+            # derive the bold variant only when that font changes
+            font = c.getFont()
+            if self._bold[0] is not font:
+                self._bold = (font, font.deriveFont(Font.BOLD))
+            c.setFont(self._bold[1])
+        else:
+            colors = None
         
+        if colors is not None:
+            c.setBackground(colors[0])
+            c.setForeground(colors[1])
         if isSelected:
             c.setBackground(table.getSelectionBackground())
-        
-        self.setHorizontalAlignment(SwingConstants.CENTER)
         return c